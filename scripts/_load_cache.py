@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Memoized JSON artifact loading shared by the generator scripts.
+
+Several generators parse the same large inputs (notably support_matrix.json).
+When they run in one process, the parse is reused for as long as the file's
+mtime and size are unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int, size: int) -> Any:
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_cached(path: str | os.PathLike[str]) -> Any:
+    """Parse a JSON file, reusing the previous parse while it is unchanged on disk.
+
+    The cached document is shared between callers, who must not change its values.
+    """
+    st = os.stat(path)
+    return _load_json(os.fspath(path), st.st_mtime_ns, st.st_size)
@@ -181,20 +181,18 @@ def _load_workload_impact(
     return impact_map, out_beads
 
 
-def _severity_for_target(target_total: int, target_covered: int, target_pct: float) -> str:
+def _severity_for_target(
+    target_total: int, target_covered: int, target_pct: float
+) -> tuple[str, int]:
     if target_total <= 0:
-        return "n/a"
+        return "n/a", 0
     if target_covered == target_total:
-        return "covered"
+        return "covered", 0
     if target_covered == 0:
-        return "critical"
+        return "critical", 3
     if target_pct < WEAK_FAMILY_THRESHOLD_PCT:
-        return "high"
-    return "medium"
-
-
-def _severity_weight(severity: str) -> int:
-    return {"critical": 3, "high": 2, "medium": 1, "covered": 0, "n/a": 0}.get(severity, 0)
+        return "high", 2
+    return "medium", 1
 
 
 def generate_matrix(
@@ -302,14 +300,14 @@ def generate_matrix(
         target_covered = int(row["target_covered"])
         target_uncovered = int(row["target_uncovered"])
         target_pct = _pct(target_covered, target_total)
-        severity = _severity_for_target(target_total, target_covered, target_pct)
+        severity, severity_weight = _severity_for_target(
+            target_total, target_covered, target_pct
+        )
 
         impact = impact_map.get(module, {"blocked_workloads": 0, "workload_ids": []})
         milestone_beads = module_to_beads.get(module, [])
         severity_score = (
-            target_uncovered * 100
-            + int(impact["blocked_workloads"]) * 10
-            + _severity_weight(severity)
+            target_uncovered * 100 + int(impact["blocked_workloads"]) * 10 + severity_weight
         )
 
         module_row = {
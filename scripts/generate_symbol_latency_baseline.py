@@ -21,19 +21,108 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from collections import defaultdict
+import sys
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 TARGET_STATUSES = {"Implemented", "RawSyscall", "GlibcCallThrough"}
 MODES = ("raw", "strict", "hardened")
 PERCENTILES = ("p50", "p95", "p99")
 HOT_PERF_CLASS = "strict_hotpath"
 TRACE_ID = "bd-3h1u.1-symbol-latency-baseline-v1"
+OVERHEAD_MODES = ("strict", "hardened")
+# Capture priority: +100 strict_hotpath, +40 fixture-covered, plus status points.
+_STATUS_SCORE = {"Implemented": 30, "RawSyscall": 20, "GlibcCallThrough": 10}
+_EMPTY_MODE_RECORD: dict[str, Any] = {
+    "p50_ns": None,
+    "p95_ns": None,
+    "p99_ns": None,
+    "capture_state": "pending_symbol_benchmark",
+    "source": None,
+}
+# (reference field, perf_baseline suite, benchmark) for shared_overhead_reference.
+_OVERHEAD_SPEC = (
+    ("runtime_math_decide_p50_ns", "runtime_math", "decide"),
+    ("runtime_math_observe_fast_p50_ns", "runtime_math", "observe_fast"),
+    ("runtime_math_decide_observe_p50_ns", "runtime_math", "decide_observe"),
+    ("membrane_validate_known_p50_ns", "membrane", "validate_known"),
+)
 
 
 def _load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(doc: Any, compact: bool = False) -> bytes:
+    # json.dumps escapes non-ASCII text as \uXXXX; orjson cannot, so its
+    # output is only kept when it is already pure ASCII.
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        out = orjson.dumps(doc, option=option)
+        if out.isascii():
+            return out
+    if compact:
+        text = json.dumps(doc, separators=(",", ":"), sort_keys=True)
+    else:
+        text = json.dumps(doc, indent=2, sort_keys=True)
+    return text.encode("ascii")
+
+
+def _write_json(handle: Any, doc: dict[str, Any]) -> None:
+    """Stream doc as sorted 2-space JSON, one top-level value / list item at a time.
+
+    The bytes are identical to dumping the whole document at once, without
+    holding the full serialized artifact in memory.
+    """
+    keys = sorted(doc)
+    last_key = len(keys) - 1
+    handle.write(b"{\n")
+    for key_idx, key in enumerate(keys):
+        value = doc[key]
+        handle.write(b"  " + _dump_json(key) + b": ")
+        if isinstance(value, list) and value:
+            last_item = len(value) - 1
+            handle.write(b"[\n")
+            for item_idx, item in enumerate(value):
+                handle.write(b"    " + _dump_json(item).replace(b"\n", b"\n    "))
+                handle.write(b",\n" if item_idx < last_item else b"\n")
+            handle.write(b"  ]")
+        else:
+            handle.write(_dump_json(value).replace(b"\n", b"\n  "))
+        handle.write(b",\n" if key_idx < last_key else b"\n")
+    handle.write(b"}\n")
+
+
+@dataclass(slots=True)
+class _SymbolRow:
+    symbol: str
+    module: str
+    status: str
+    perf_class: str
+
+
+def _normalize_symbols(symbols: list[Any]) -> list[_SymbolRow]:
+    rows = [
+        _SymbolRow(
+            symbol=str(row.get("symbol", "")),
+            module=sys.intern(str(row.get("module", "unknown"))),
+            status=sys.intern(str(row.get("status", "Unknown"))),
+            perf_class=sys.intern(str(row.get("perf_class", "unknown"))),
+        )
+        for row in symbols
+    ]
+    rows.sort(key=attrgetter("module", "symbol"))
+    return rows
 
 
 def _safe_float(value: Any) -> float | None:
@@ -42,16 +131,6 @@ def _safe_float(value: Any) -> float | None:
     return None
 
 
-def _mode_record() -> dict[str, Any]:
-    return {
-        "p50_ns": None,
-        "p95_ns": None,
-        "p99_ns": None,
-        "capture_state": "pending_symbol_benchmark",
-        "source": None,
-    }
-
-
 def _read_fixture_coverage(path: str) -> dict[str, bool]:
     doc = _load_json(path)
     out: dict[str, bool] = {}
@@ -65,42 +144,29 @@ def _read_fixture_coverage(path: str) -> dict[str, bool]:
 
 def _shared_overhead_reference(perf_baseline: dict[str, Any]) -> dict[str, Any]:
     p50 = perf_baseline.get("baseline_p50_ns_op", {})
-
-    def _p50(suite: str, mode: str, bench: str) -> float | None:
-        return _safe_float(p50.get(suite, {}).get(mode, {}).get(bench))
-
     return {
-        "strict": {
-            "runtime_math_decide_p50_ns": _p50("runtime_math", "strict", "decide"),
-            "runtime_math_observe_fast_p50_ns": _p50("runtime_math", "strict", "observe_fast"),
-            "runtime_math_decide_observe_p50_ns": _p50("runtime_math", "strict", "decide_observe"),
-            "membrane_validate_known_p50_ns": _p50("membrane", "strict", "validate_known"),
-        },
-        "hardened": {
-            "runtime_math_decide_p50_ns": _p50("runtime_math", "hardened", "decide"),
-            "runtime_math_observe_fast_p50_ns": _p50("runtime_math", "hardened", "observe_fast"),
-            "runtime_math_decide_observe_p50_ns": _p50("runtime_math", "hardened", "decide_observe"),
-            "membrane_validate_known_p50_ns": _p50("membrane", "hardened", "validate_known"),
-        },
+        mode: {
+            name: _safe_float(p50.get(suite, {}).get(mode, {}).get(bench))
+            for name, suite, bench in _OVERHEAD_SPEC
+        }
+        for mode in OVERHEAD_MODES
     }
 
 
-def _priority_score(row: dict[str, Any], fixture_covered: bool) -> int:
-    score = 0
-    if row.get("perf_class") == HOT_PERF_CLASS:
-        score += 100
-    if fixture_covered:
-        score += 40
-
-    status = row.get("status")
-    if status == "Implemented":
-        score += 30
-    elif status == "RawSyscall":
-        score += 20
-    elif status == "GlibcCallThrough":
-        score += 10
-
-    return score
+def _breakdown_counts(
+    key: str,
+    total: dict[str, int],
+    covered: dict[str, int],
+    hot: dict[str, int],
+) -> dict[str, int]:
+    key_total = total[key]
+    key_covered = covered.get(key, 0)
+    return {
+        "total": key_total,
+        "fixture_covered": key_covered,
+        "fixture_uncovered": key_total - key_covered,
+        "strict_hotpath": hot.get(key, 0),
+    }
 
 
 def generate_inventory(
@@ -117,150 +183,102 @@ def generate_inventory(
         raise ValueError("support_matrix.json: symbols must be a list")
 
     shared_ref = _shared_overhead_reference(perf_baseline)
+    # Every freshly generated row is identical and all-pending, so rows alias
+    # one baseline object; ingestion works on a re-parsed copy of the artifact.
+    pending_baseline = {mode: _EMPTY_MODE_RECORD.copy() for mode in MODES}
 
     symbol_rows: list[dict[str, Any]] = []
-    status_breakdown: dict[str, dict[str, int]] = defaultdict(
-        lambda: {
-            "total": 0,
-            "fixture_covered": 0,
-            "fixture_uncovered": 0,
-            "strict_hotpath": 0,
-        }
-    )
-    module_breakdown: dict[str, dict[str, Any]] = {}
-
-    for row in sorted(symbols, key=lambda r: (str(r.get("module", "")), str(r.get("symbol", "")))):
-        symbol = str(row.get("symbol", ""))
-        module = str(row.get("module", "unknown"))
-        status = str(row.get("status", "Unknown"))
-        perf_class = str(row.get("perf_class", "unknown"))
+    # Flat per-key tallies; the nested breakdown rows are assembled once below.
+    status_total: dict[str, int] = {}
+    status_covered: dict[str, int] = {}
+    status_hot: dict[str, int] = {}
+    module_total: dict[str, int] = {}
+    module_covered: dict[str, int] = {}
+    module_hot: dict[str, int] = {}
+    module_status_total: dict[tuple[str, str], int] = {}
+    target_symbols = 0
+    fixture_covered = 0
+    strict_hotpath_symbols = 0
+    # (-score, module, symbol, row index, queue entry) tuples; plain tuple
+    # ordering gives the capture queue order without a per-row key function,
+    # and the unique row index keeps entries from ever being compared.
+    queue_keys: list[tuple[int, str, str, int, dict[str, Any]]] = []
+
+    for row in _normalize_symbols(symbols):
+        symbol = row.symbol
+        module = row.module
+        status = row.status
+        perf_class = row.perf_class
 
         covered = bool(fixture_cov.get(symbol, False))
 
-        mode_records = {mode: _mode_record() for mode in MODES}
-
-        score = _priority_score(
-            {
-                "status": status,
-                "perf_class": perf_class,
-            },
-            covered,
-        )
-
-        symbol_rows.append(
-            {
-                "symbol": symbol,
-                "module": module,
-                "status": status,
-                "perf_class": perf_class,
-                "fixture_covered": covered,
-                "capture_priority_score": score,
-                "baseline": mode_records,
-                "shared_overhead_reference": shared_ref,
-            }
-        )
-
-        st = status_breakdown[status]
-        st["total"] += 1
-        if covered:
-            st["fixture_covered"] += 1
-        else:
-            st["fixture_uncovered"] += 1
+        score = _STATUS_SCORE.get(status, 0)
         if perf_class == HOT_PERF_CLASS:
-            st["strict_hotpath"] += 1
-
-        module_row = module_breakdown.setdefault(
-            module,
-            {
-                "module": module,
-                "total": 0,
-                "fixture_covered": 0,
-                "fixture_uncovered": 0,
-                "strict_hotpath": 0,
-                "status_breakdown": defaultdict(int),
-            },
-        )
-        module_row["total"] += 1
+            score += 100
         if covered:
-            module_row["fixture_covered"] += 1
-        else:
-            module_row["fixture_uncovered"] += 1
+            score += 40
+
+        queue_entry = {
+            "symbol": symbol,
+            "module": module,
+            "status": status,
+            "perf_class": perf_class,
+            "fixture_covered": covered,
+            "capture_priority_score": score,
+        }
+        queue_keys.append((-score, module, symbol, len(symbol_rows), queue_entry))
+        symbol_rows.append({**queue_entry, "baseline": pending_baseline})
+
+        if status in TARGET_STATUSES:
+            target_symbols += 1
+        status_total[status] = status_total.get(status, 0) + 1
+        module_total[module] = module_total.get(module, 0) + 1
+        module_status_key = (module, status)
+        module_status_total[module_status_key] = module_status_total.get(module_status_key, 0) + 1
+        if covered:
+            fixture_covered += 1
+            status_covered[status] = status_covered.get(status, 0) + 1
+            module_covered[module] = module_covered.get(module, 0) + 1
         if perf_class == HOT_PERF_CLASS:
-            module_row["strict_hotpath"] += 1
-        module_row["status_breakdown"][status] += 1
+            strict_hotpath_symbols += 1
+            status_hot[status] = status_hot.get(status, 0) + 1
+            module_hot[module] = module_hot.get(module, 0) + 1
 
     total_symbols = len(symbol_rows)
-    target_symbols = sum(1 for row in symbol_rows if row["status"] in TARGET_STATUSES)
-    fixture_covered = sum(1 for row in symbol_rows if row["fixture_covered"])
 
+    # Freshly generated mode records are all pending (see _EMPTY_MODE_RECORD), so
+    # nothing is measured yet; ingestion recomputes these counts from samples.
     measured_counts: dict[str, dict[str, int]] = {
         mode: {pct: 0 for pct in PERCENTILES} for mode in MODES
     }
-    for row in symbol_rows:
-        baseline = row["baseline"]
-        for mode in MODES:
-            mode_row = baseline[mode]
-            if mode_row["p50_ns"] is not None:
-                measured_counts[mode]["p50"] += 1
-            if mode_row["p95_ns"] is not None:
-                measured_counts[mode]["p95"] += 1
-            if mode_row["p99_ns"] is not None:
-                measured_counts[mode]["p99"] += 1
-
     pending_counts: dict[str, dict[str, int]] = {
-        mode: {
-            pct: total_symbols - measured_counts[mode][pct] for pct in PERCENTILES
-        }
-        for mode in MODES
+        mode: {pct: total_symbols for pct in PERCENTILES} for mode in MODES
     }
 
-    queue_rows = sorted(
-        symbol_rows,
-        key=lambda row: (
-            -int(row["capture_priority_score"]),
-            row["module"],
-            row["symbol"],
-        ),
-    )
-
-    capture_queue = [
-        {
-            "symbol": row["symbol"],
-            "module": row["module"],
-            "status": row["status"],
-            "perf_class": row["perf_class"],
-            "fixture_covered": row["fixture_covered"],
-            "capture_priority_score": row["capture_priority_score"],
-        }
-        for row in queue_rows
-    ]
+    queue_keys.sort()
+    capture_queue = [entry for _, _, _, _, entry in queue_keys]
 
+    # Every module has at least one (module, status) tally, so one sort over
+    # those pairs yields module rows and their status maps already in order.
     module_rows = []
-    for module in sorted(module_breakdown.keys()):
-        row = module_breakdown[module]
-        status_row = {
-            status: int(count)
-            for status, count in sorted(row["status_breakdown"].items(), key=lambda item: item[0])
-        }
-        module_rows.append(
-            {
-                "module": module,
-                "total": int(row["total"]),
-                "fixture_covered": int(row["fixture_covered"]),
-                "fixture_uncovered": int(row["fixture_uncovered"]),
-                "strict_hotpath": int(row["strict_hotpath"]),
-                "status_breakdown": status_row,
-            }
-        )
+    current_module = None
+    status_row: dict[str, int] = {}
+    for (module, status), count in sorted(module_status_total.items()):
+        if module != current_module:
+            current_module = module
+            status_row = {}
+            module_rows.append(
+                {
+                    "module": module,
+                    **_breakdown_counts(module, module_total, module_covered, module_hot),
+                    "status_breakdown": status_row,
+                }
+            )
+        status_row[status] = count
 
     status_rows = {
-        status: {
-            "total": int(info["total"]),
-            "fixture_covered": int(info["fixture_covered"]),
-            "fixture_uncovered": int(info["fixture_uncovered"]),
-            "strict_hotpath": int(info["strict_hotpath"]),
-        }
-        for status, info in sorted(status_breakdown.items(), key=lambda item: item[0])
+        status: _breakdown_counts(status, status_total, status_covered, status_hot)
+        for status in sorted(status_total)
     }
 
     return {
@@ -269,7 +287,8 @@ def generate_inventory(
         "description": (
             "Symbol-level latency baseline inventory across all exported symbols. "
             "Tracks strict/hardened/raw p50/p95/p99 capture coverage and pending gaps "
-            "without fabricating measurements."
+            "without fabricating measurements. The shared runtime_math/membrane p50 "
+            "overhead reference applies to every symbol and is recorded once at the root."
         ),
         "trace_id": TRACE_ID,
         "generated_at_utc": str(support.get("generated_at_utc", "unknown")),
@@ -287,6 +306,7 @@ def generate_inventory(
                 "p99": bool(perf_baseline.get("baseline_p99_ns_op")),
             },
         },
+        "shared_overhead_reference": shared_ref,
         "summary": {
             "total_symbols": total_symbols,
             "target_statuses": sorted(TARGET_STATUSES),
@@ -295,9 +315,7 @@ def generate_inventory(
             "fixture_uncovered_symbols": total_symbols - fixture_covered,
             "mode_percentile_measured_counts": measured_counts,
             "mode_percentile_pending_counts": pending_counts,
-            "strict_hotpath_symbols": sum(
-                1 for row in symbol_rows if row["perf_class"] == HOT_PERF_CLASS
-            ),
+            "strict_hotpath_symbols": strict_hotpath_symbols,
             "capture_queue_size": len(capture_queue),
         },
         "status_breakdown": status_rows,
@@ -336,6 +354,11 @@ def main() -> int:
         default="tests/conformance/symbol_latency_baseline.v1.json",
         help="Output artifact path",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write compact single-line JSON instead of the 2-space indented form",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -350,9 +373,11 @@ def main() -> int:
     )
 
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as handle:
-        json.dump(artifact, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    with open(args.output, "wb") as handle:
+        if args.compact:
+            handle.write(_dump_json(artifact, compact=True) + b"\n")
+        else:
+            _write_json(handle, artifact)
 
     if not args.quiet:
         print(
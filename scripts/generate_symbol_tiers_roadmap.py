@@ -16,8 +16,20 @@ import json
 import sys
 from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    from _load_cache import load_json_cached
+except ImportError:  # imported as a module from outside scripts/
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from _load_cache import load_json_cached
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 
 def find_repo_root():
     p = Path(__file__).resolve().parent.parent
@@ -26,10 +38,47 @@ def find_repo_root():
     return Path.cwd()
 
 
-def load_json_file(path):
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
-
+def dump_json(doc, compact=False):
+    """Serialize doc as ASCII JSON bytes (no trailing newline).
+
+    2-space indented by default; compact uses "," / ":" separators and no indent.
+    Non-ASCII text is written as \\uXXXX escapes like json.dumps does; orjson
+    cannot escape, so its output is only used when it is already pure ASCII.
+    """
+    if orjson is not None:
+        out = orjson.dumps(doc) if compact else orjson.dumps(doc, option=orjson.OPT_INDENT_2)
+        if out.isascii():
+            return out
+    if compact:
+        return json.dumps(doc, separators=(",", ":")).encode("ascii")
+    return json.dumps(doc, indent=2).encode("ascii")
+
+
+def write_json(stream, doc):
+    """Stream doc as 2-space indented JSON to a binary stream, one top-level value at a time.
+
+    Produces the same bytes as dump_json(doc) without building them as a whole.
+    """
+    keys = list(doc)
+    last_key = len(keys) - 1
+    stream.write(b"{\n")
+    for key_idx, key in enumerate(keys):
+        value = doc[key]
+        stream.write(b"  " + dump_json(key) + b": ")
+        if isinstance(value, list) and value:
+            last_item = len(value) - 1
+            stream.write(b"[\n")
+            for item_idx, item in enumerate(value):
+                stream.write(b"    " + dump_json(item).replace(b"\n", b"\n    "))
+                stream.write(b",\n" if item_idx < last_item else b"\n")
+            stream.write(b"  ]")
+        else:
+            stream.write(dump_json(value).replace(b"\n", b"\n  "))
+        stream.write(b",\n" if key_idx < last_key else b"\n")
+    stream.write(b"}")
+
+
+INTERNED_SYMBOL_FIELDS = ("family", "module", "classification", "perf_class")
 
 # Tier boundaries
 TIER_BOUNDARIES = [
@@ -97,6 +146,13 @@ WAVE_DEFINITIONS = [
     },
 ]
 
+# Family -> wave lookup derived from WAVE_DEFINITIONS
+FAMILY_WAVE_MAP = {
+    fam: wave_def["wave"]
+    for wave_def in WAVE_DEFINITIONS
+    for fam in wave_def["target_families"]
+}
+
 # Wave acceptance checklist
 WAVE_ACCEPTANCE_CHECKLIST = [
     {
@@ -137,28 +193,39 @@ WAVE_ACCEPTANCE_CHECKLIST = [
 ]
 
 
-def assign_tier(rank, total):
-    """Assign tier based on rank position."""
-    for tier_name, boundary in TIER_BOUNDARIES:
-        if rank <= boundary:
-            return tier_name
-    return "all"
+def rank_tiers(total):
+    """Tier name for each rank 1..total, walking TIER_BOUNDARIES once."""
+    tiers = []
+    bidx = 0
+    last = len(TIER_BOUNDARIES) - 1
+    for rank in range(1, total + 1):
+        while bidx < last and rank > TIER_BOUNDARIES[bidx][1]:
+            bidx += 1
+        tiers.append(TIER_BOUNDARIES[bidx][0])
+    return tiers
+
+
+def utc_timestamp():
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, formatted without strftime."""
+    now = datetime.now(timezone.utc)
+    return (f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+            f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}Z")
 
 
 def compute_roadmap_hash(tiers):
-    """Deterministic hash for the roadmap output."""
-    canonical = json.dumps(
-        [(t["symbol"], t["tier"], t["wave"]) for t in tiers],
-        sort_keys=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    """Deterministic hash for the roadmap output (one symbol|tier|wave line per entry)."""
+    h = hashlib.sha256()
+    for t in tiers:
+        h.update(f"{t['symbol']}|{t['tier']}|{t['wave']}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Symbol tiers and family wave roadmap generator")
     parser.add_argument("-o", "--output", help="Output file path")
+    parser.add_argument("--compact", action="store_true",
+                        help="Emit compact single-line JSON instead of indented output")
     args = parser.parse_args()
 
     root = find_repo_root()
@@ -169,29 +236,34 @@ def main():
               "(run bd-2vv.9 first)", file=sys.stderr)
         sys.exit(1)
 
-    norm_data = load_json_file(norm_path)
+    norm_data = load_json_cached(norm_path)
     normalized_symbols = norm_data.get("normalized_symbols", [])
 
     if not normalized_symbols:
         print("ERROR: No normalized symbols found", file=sys.stderr)
         sys.exit(1)
 
-    # Build family-to-wave mapping
-    family_wave_map = {}
-    for wave_def in WAVE_DEFINITIONS:
-        for fam in wave_def["target_families"]:
-            family_wave_map[fam] = wave_def["wave"]
+    # Low-cardinality fields are grouped and compared per symbol; intern them
+    # so every row shares one string object per distinct value. The rows are
+    # copies: the loaded document is cached and shared.
+    symbols = []
+    for sym in normalized_symbols:
+        row = dict(sym)
+        for field in INTERNED_SYMBOL_FIELDS:
+            row[field] = sys.intern(sym[field])
+        symbols.append(row)
 
     # Sort symbols by priority_score (descending) for tier assignment
-    ranked = sorted(normalized_symbols,
-                    key=lambda s: s["priority_score"], reverse=True)
+    ranked = sorted(symbols,
+                    key=itemgetter("priority_score"), reverse=True)
 
     # Assign tiers and waves
+    rank_to_tier = rank_tiers(len(ranked))
     tiered_symbols = []
     for rank_idx, sym in enumerate(ranked):
         rank = rank_idx + 1
-        tier = assign_tier(rank, len(ranked))
-        wave = family_wave_map.get(sym["family"], 5)
+        tier = rank_to_tier[rank_idx]
+        wave = FAMILY_WAVE_MAP.get(sym["family"], 5)
 
         tiered_symbols.append({
             "symbol": sym["symbol"],
@@ -207,24 +279,56 @@ def main():
             "replacement_complexity": sym["replacement_complexity"],
         })
 
-    # Sort for output stability
-    tiered_symbols.sort(key=lambda s: (s["wave"], -s["priority_score"], s["symbol"]))
+    # Sort for output stability: (wave, -priority_score, symbol) via stable
+    # least-significant-key-first passes (reverse=True keeps ties in order).
+    tiered_symbols.sort(key=itemgetter("symbol"))
+    tiered_symbols.sort(key=itemgetter("priority_score"), reverse=True)
+    tiered_symbols.sort(key=itemgetter("wave"))
 
-    # Tier statistics
+    # Tier, wave and family grouping in a single pass
     tier_stats = defaultdict(lambda: {"count": 0, "native": 0, "symbols": []})
+    wave_groups = {
+        wave_def["wave"]: {"native": 0, "families": set(), "symbols": []}
+        for wave_def in WAVE_DEFINITIONS
+    }
+    family_readiness = {}
     for t in tiered_symbols:
-        tier_stats[t["tier"]]["count"] += 1
-        if t["classification"] == "native":
-            tier_stats[t["tier"]]["native"] += 1
-        tier_stats[t["tier"]]["symbols"].append(t["symbol"])
+        symbol = t["symbol"]
+        fam = t["family"]
+        is_native = t["classification"] == "native"
+
+        tier_info = tier_stats[t["tier"]]
+        tier_info["count"] += 1
+        tier_info["symbols"].append(symbol)
+
+        wave_info = wave_groups[t["wave"]]
+        wave_info["families"].add(fam)
+        wave_info["symbols"].append(symbol)
+
+        fam_info = family_readiness.get(fam)
+        if fam_info is None:
+            fam_info = family_readiness[fam] = {
+                "wave": t["wave"],
+                "total": 0,
+                "native": 0,
+                "symbols": [],
+            }
+        fam_info["total"] += 1
+        fam_info["symbols"].append(symbol)
+
+        if is_native:
+            tier_info["native"] += 1
+            wave_info["native"] += 1
+            fam_info["native"] += 1
 
     # Wave statistics
     wave_stats = {}
     for wave_def in WAVE_DEFINITIONS:
         wave_num = wave_def["wave"]
-        wave_syms = [t for t in tiered_symbols if t["wave"] == wave_num]
-        native_count = sum(1 for s in wave_syms if s["classification"] == "native")
-        families_in_wave = sorted(set(s["family"] for s in wave_syms))
+        wave_info = wave_groups[wave_num]
+        wave_syms = wave_info["symbols"]
+        native_count = wave_info["native"]
+        families_in_wave = sorted(wave_info["families"])
 
         wave_stats[str(wave_num)] = {
             "name": wave_def["name"],
@@ -236,27 +340,12 @@ def main():
             if wave_syms else 0,
             "families": families_in_wave,
             "family_count": len(families_in_wave),
-            "symbols": [s["symbol"] for s in wave_syms],
+            "symbols": wave_syms,
             "readiness": "complete" if native_count == len(wave_syms)
             else "in-progress" if native_count > 0 else "planned",
         }
 
     # Family readiness per wave
-    family_readiness = {}
-    for t in tiered_symbols:
-        fam = t["family"]
-        if fam not in family_readiness:
-            family_readiness[fam] = {
-                "wave": t["wave"],
-                "total": 0,
-                "native": 0,
-                "symbols": [],
-            }
-        family_readiness[fam]["total"] += 1
-        if t["classification"] == "native":
-            family_readiness[fam]["native"] += 1
-        family_readiness[fam]["symbols"].append(t["symbol"])
-
     for fam, info in family_readiness.items():
         info["native_pct"] = round(info["native"] / info["total"] * 100, 1) \
             if info["total"] else 0
@@ -268,7 +357,7 @@ def main():
     report = {
         "schema_version": "v1",
         "bead": "bd-2vv.10",
-        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "generated_at": utc_timestamp(),
         "roadmap_hash": roadmap_hash,
         "summary": {
             "total_symbols": len(tiered_symbols),
@@ -299,13 +388,22 @@ def main():
         },
     }
 
-    output = json.dumps(report, indent=2) + "\n"
     if args.output:
         Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        Path(args.output).write_text(output)
+        with open(args.output, "wb") as f:
+            if args.compact:
+                f.write(dump_json(report, compact=True))
+            else:
+                write_json(f, report)
+            f.write(b"\n")
         print(f"Report written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        sys.stdout.flush()
+        if args.compact:
+            sys.stdout.buffer.write(dump_json(report, compact=True))
+        else:
+            write_json(sys.stdout.buffer, report)
+        sys.stdout.buffer.write(b"\n\n")
 
 
 if __name__ == "__main__":
@@ -16,8 +16,20 @@ import json
 import sys
 from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    from _load_cache import load_json_cached
+except ImportError:  # imported as a module from outside scripts/
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from _load_cache import load_json_cached
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 
 def find_repo_root():
     p = Path(__file__).resolve().parent.parent
@@ -26,11 +38,6 @@ def find_repo_root():
     return Path.cwd()
 
 
-def load_json_file(path):
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
-
-
 # Canonical module-to-family mapping
 MODULE_TO_FAMILY = {
     "ctype_abi": "ctype",
@@ -64,28 +71,22 @@ MODULE_TO_FAMILY = {
 }
 
 # Valid support states
-VALID_STATUSES = {"Implemented", "RawSyscall", "GlibcCallThrough"}
+VALID_STATUSES = frozenset({"Implemented", "RawSyscall", "GlibcCallThrough"})
 
 # Valid perf classes
-VALID_PERF_CLASSES = {"strict_hotpath", "coldpath", "hardened_hotpath"}
+VALID_PERF_CLASSES = frozenset({"strict_hotpath", "coldpath", "hardened_hotpath"})
 
-# Classification confidence levels
+# Classification confidence levels, keyed by (status, perf_class)
 CONFIDENCE_RULES = {
-    "Implemented": {
-        "strict_hotpath": "high",
-        "coldpath": "high",
-        "hardened_hotpath": "high",
-    },
-    "RawSyscall": {
-        "strict_hotpath": "medium",
-        "coldpath": "medium",
-        "hardened_hotpath": "medium",
-    },
-    "GlibcCallThrough": {
-        "strict_hotpath": "low",
-        "coldpath": "low",
-        "hardened_hotpath": "low",
-    },
+    ("Implemented", "strict_hotpath"): "high",
+    ("Implemented", "coldpath"): "high",
+    ("Implemented", "hardened_hotpath"): "high",
+    ("RawSyscall", "strict_hotpath"): "medium",
+    ("RawSyscall", "coldpath"): "medium",
+    ("RawSyscall", "hardened_hotpath"): "medium",
+    ("GlibcCallThrough", "strict_hotpath"): "low",
+    ("GlibcCallThrough", "coldpath"): "low",
+    ("GlibcCallThrough", "hardened_hotpath"): "low",
 }
 
 # Runtime impact weights
@@ -130,30 +131,26 @@ MODULE_COMPLEXITY = {
 COMPLEXITY_WEIGHTS = {"low": 1, "medium": 2, "high": 3}
 
 
-def normalize_symbol(sym_entry):
-    """Normalize a symbol entry into canonical form."""
-    issues = []
+STATUS_CLASSIFICATION = {
+    "Implemented": "native",
+    "RawSyscall": "syscall-passthrough",
+    "GlibcCallThrough": "host-delegated",
+}
 
-    symbol = sym_entry.get("symbol", "").strip()
-    if not symbol:
-        issues.append("empty symbol name")
 
-    status = sym_entry.get("status", "")
+def derive_category(status, module, perf_class):
+    """Fields and issues that depend only on (status, module, perf_class)."""
+    issues = []
     if status not in VALID_STATUSES:
         issues.append(f"unknown status: {status}")
 
-    module = sym_entry.get("module", "")
     family = MODULE_TO_FAMILY.get(module, "unknown")
     if family == "unknown" and module:
         issues.append(f"unmapped module: {module}")
 
-    perf_class = sym_entry.get("perf_class", "coldpath")
     if perf_class not in VALID_PERF_CLASSES:
         issues.append(f"unknown perf_class: {perf_class}")
 
-    # Confidence
-    confidence = CONFIDENCE_RULES.get(status, {}).get(perf_class, "unknown")
-
     # Runtime impact score
     impact = RUNTIME_IMPACT.get(perf_class, 0)
 
@@ -161,51 +158,101 @@ def normalize_symbol(sym_entry):
     complexity_label = MODULE_COMPLEXITY.get(module, "medium")
     complexity = COMPLEXITY_WEIGHTS.get(complexity_label, 2)
 
-    # Priority score: higher = more important to have natively implemented
-    priority_score = impact * 100 - complexity * 10
-
-    # Support classification
-    if status == "Implemented":
-        classification = "native"
-    elif status == "RawSyscall":
-        classification = "syscall-passthrough"
-    elif status == "GlibcCallThrough":
-        classification = "host-delegated"
-    else:
-        classification = "unknown"
-
     return {
-        "symbol": symbol,
-        "module": module,
         "family": family,
-        "status": status,
-        "perf_class": perf_class,
-        "classification": classification,
-        "confidence": confidence,
+        "classification": STATUS_CLASSIFICATION.get(status, "unknown"),
+        "confidence": CONFIDENCE_RULES.get((status, perf_class), "unknown"),
         "runtime_impact": impact,
         "replacement_complexity": complexity_label,
-        "priority_score": priority_score,
-        "default_stub": sym_entry.get("default_stub", False),
-        "strict_semantics": sym_entry.get("strict_semantics", ""),
-        "hardened_semantics": sym_entry.get("hardened_semantics", ""),
-        "issues": issues,
+        # Priority score: higher = more important to have natively implemented
+        "priority_score": impact * 100 - complexity * 10,
+        "issues": tuple(issues),
     }
 
 
+def normalize_symbols(entries):
+    """Normalize symbol entries into canonical form.
+
+    Symbols share a handful of (status, module, perf_class) categories, so the
+    derived fields are computed once per distinct category and reused.
+    """
+    categories = {}
+    category_of = categories.get
+    normalized = []
+    append = normalized.append
+    for sym_entry in entries:
+        get = sym_entry.get
+        status = get("status", "")
+        module = get("module", "")
+        perf_class = get("perf_class", "coldpath")
+        key = (status, module, perf_class)
+        derived = category_of(key)
+        if derived is None:
+            derived = categories[key] = derive_category(status, module, perf_class)
+
+        symbol = get("symbol", "").strip()
+        issues = list(derived["issues"])
+        if not symbol:
+            issues.insert(0, "empty symbol name")
+
+        append({
+            "symbol": symbol,
+            "module": module,
+            "family": derived["family"],
+            "status": status,
+            "perf_class": perf_class,
+            "classification": derived["classification"],
+            "confidence": derived["confidence"],
+            "runtime_impact": derived["runtime_impact"],
+            "replacement_complexity": derived["replacement_complexity"],
+            "priority_score": derived["priority_score"],
+            "default_stub": get("default_stub", False),
+            "strict_semantics": get("strict_semantics", ""),
+            "hardened_semantics": get("hardened_semantics", ""),
+            "issues": issues,
+        })
+    return normalized
+
+
+def normalize_symbol(sym_entry):
+    """Normalize a single symbol entry into canonical form."""
+    return normalize_symbols([sym_entry])[0]
+
+
 def compute_universe_hash(normalized_symbols):
     """Compute deterministic hash of the full normalized symbol set."""
-    canonical = json.dumps(
-        [{"s": s["symbol"], "c": s["classification"]} for s in normalized_symbols],
-        sort_keys=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    pairs = [(s["symbol"], s["classification"]) for s in normalized_symbols]
+    if orjson is not None:
+        canonical = orjson.dumps(pairs)
+    else:
+        canonical = json.dumps(pairs, separators=(",", ":"), ensure_ascii=False).encode()
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def write_symbols_ndjson(path, normalized_symbols):
+    """Stream one compact JSON object per symbol to path; return the file's SHA-256."""
+    h = hashlib.sha256()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        for sym in normalized_symbols:
+            if orjson is not None:
+                line = orjson.dumps(sym, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = (json.dumps(sym, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+            h.update(line)
+            f.write(line)
+    return h.hexdigest()
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Symbol universe normalization and classification pipeline")
     parser.add_argument("-o", "--output", help="Output file path")
+    parser.add_argument(
+        "--symbols-ndjson",
+        help="Write normalized_symbols to this NDJSON file (one symbol per line) "
+             "and reference it from the report instead of inlining the array")
     args = parser.parse_args()
 
     root = find_repo_root()
@@ -215,7 +262,7 @@ def main():
         print("ERROR: support_matrix.json not found", file=sys.stderr)
         sys.exit(1)
 
-    matrix = load_json_file(matrix_path)
+    matrix = load_json_cached(matrix_path)
     symbols_list = matrix.get("symbols", [])
 
     # Normalize all symbols
@@ -223,8 +270,7 @@ def main():
     seen_names = set()
     duplicates = []
 
-    for entry in symbols_list:
-        norm = normalize_symbol(entry)
+    for norm in normalize_symbols(symbols_list):
         name = norm["symbol"]
         if name in seen_names:
             duplicates.append(name)
@@ -232,32 +278,36 @@ def main():
         normalized.append(norm)
 
     # Sort for reproducibility
-    normalized.sort(key=lambda s: s["symbol"])
+    normalized.sort(key=itemgetter("symbol"))
 
-    # Classification summary
+    # Classification summary, unknown/unverified symbols and per-family native
+    # counts, grouped in a single pass
     by_classification = defaultdict(list)
     by_family = defaultdict(list)
     by_confidence = defaultdict(list)
     by_perf = defaultdict(list)
+    family_native = defaultdict(int)
+    unknown_action_list = []
 
     for s in normalized:
-        by_classification[s["classification"]].append(s["symbol"])
-        by_family[s["family"]].append(s["symbol"])
-        by_confidence[s["confidence"]].append(s["symbol"])
-        by_perf[s["perf_class"]].append(s["symbol"])
+        symbol = s["symbol"]
+        classification = s["classification"]
+        by_classification[classification].append(symbol)
+        by_family[s["family"]].append(symbol)
+        by_confidence[s["confidence"]].append(symbol)
+        by_perf[s["perf_class"]].append(symbol)
+        if classification == "native":
+            family_native[s["family"]] += 1
 
-    # Unknown/unverified symbols
-    unknown_action_list = []
-    for s in normalized:
         if s["issues"]:
             unknown_action_list.append({
-                "symbol": s["symbol"],
+                "symbol": symbol,
                 "issues": s["issues"],
                 "action": "investigate",
             })
-        elif s["classification"] == "host-delegated" and s["perf_class"] == "strict_hotpath":
+        elif classification == "host-delegated" and s["perf_class"] == "strict_hotpath":
             unknown_action_list.append({
-                "symbol": s["symbol"],
+                "symbol": symbol,
                 "issues": ["hotpath symbol delegated to host glibc"],
                 "action": "prioritize-replacement",
             })
@@ -265,10 +315,7 @@ def main():
     # Family statistics
     family_stats = {}
     for fam, syms in sorted(by_family.items()):
-        native_count = sum(
-            1 for s in normalized
-            if s["family"] == fam and s["classification"] == "native"
-        )
+        native_count = family_native[fam]
         family_stats[fam] = {
             "total": len(syms),
             "native": native_count,
@@ -278,6 +325,15 @@ def main():
 
     universe_hash = compute_universe_hash(normalized)
 
+    if args.symbols_ndjson:
+        symbols_fields = {
+            "normalized_symbols_file": args.symbols_ndjson,
+            "normalized_symbols_sha256": write_symbols_ndjson(args.symbols_ndjson, normalized),
+        }
+        print(f"Symbols written to {args.symbols_ndjson}", file=sys.stderr)
+    else:
+        symbols_fields = {"normalized_symbols": normalized}
+
     report = {
         "schema_version": "v1",
         "bead": "bd-2vv.9",
@@ -302,7 +358,7 @@ def main():
                 len(by_classification.get("native", [])) / len(normalized) * 100, 1
             ) if normalized else 0,
         },
-        "normalized_symbols": normalized,
+        **symbols_fields,
         "family_statistics": family_stats,
         "unknown_action_list": unknown_action_list,
         "classification_rules": {
@@ -6,10 +6,25 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import mmap
+import os
+import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    from _load_cache import load_json_cached
+except ImportError:  # imported as a module from outside scripts/
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from _load_cache import load_json_cached
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 PRIORITY_WEIGHTS = {
     "critical": 3.0,
     "high": 2.0,
@@ -30,6 +45,15 @@ MODULE_BEAD_OVERRIDES = {
     "dlfcn_abi": ["bd-3rn", "bd-33zg"],
 }
 
+# Shared read-only fallback for modules no workload names critical symbols in.
+_NO_CRITICAL_SYMBOLS: Counter[str] = Counter()
+
+INPUT_ARTIFACTS = (
+    ("workload_matrix", "tests/conformance/workload_matrix.json"),
+    ("support_matrix", "support_matrix.json"),
+    ("callthrough_census", "tests/conformance/callthrough_census.v1.json"),
+)
+
 INTEGRATION_HOOKS = {
     "setjmp": ["bd-1gh"],
     "tls": ["bd-rth1", "bd-yos"],
@@ -38,15 +62,20 @@ INTEGRATION_HOOKS = {
 }
 
 
-def load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+def render_json(doc: Any) -> bytes:
+    """2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(doc, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def sha256_file(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
+        # mmap rejects empty files; their digest is just the empty-input hash.
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
     return h.hexdigest()
 
 
@@ -56,6 +85,23 @@ def severity_weight(status: str, perf_class: str) -> float:
     return SEVERITY_WEIGHTS.get(f"{status}:{perf_class}", 1.0)
 
 
+def require_str_fields(
+    rows: list[dict[str, Any]],
+    fields: tuple[str, ...],
+    label: str,
+    list_fields: tuple[str, ...] = (),
+) -> None:
+    """Reject rows whose identifier fields are not strings, so the scoring
+    loops can use them as-is instead of coercing every value with str()."""
+    for row in rows:
+        for field in fields:
+            if not isinstance(row.get(field), str):
+                raise ValueError(f"{label} row has non-string {field!r}: {row.get(field)!r}")
+        for field in list_fields:
+            if not all(isinstance(value, str) for value in row.get(field, [])):
+                raise ValueError(f"{label} row has non-string entries in {field!r}: {row.get(field)!r}")
+
+
 def build_plan(
     workload_matrix: dict[str, Any],
     support_matrix: dict[str, Any],
@@ -68,18 +114,19 @@ def build_plan(
         for row in symbols
         if row.get("status") in {"GlibcCallThrough", "Stub"}
     ]
+    require_str_fields(candidates, ("symbol", "module", "status", "perf_class"), "support_matrix symbol")
 
     workloads = workload_matrix.get("workloads", [])
+    require_str_fields(workloads, ("id",), "workload", list_fields=("blocked_by", "critical_symbols"))
     module_workload_ids: dict[str, set[str]] = defaultdict(set)
     module_weighted_impact: dict[str, float] = defaultdict(float)
     module_critical_symbols: dict[str, Counter[str]] = defaultdict(Counter)
 
     for workload in workloads:
-        w_id = str(workload.get("id"))
+        w_id = workload["id"]
         weight = PRIORITY_WEIGHTS.get(str(workload.get("priority_impact", "medium")).lower(), 1.0)
-        blocked_modules = [str(m) for m in workload.get("blocked_by", [])]
-        critical_symbols = [str(s) for s in workload.get("critical_symbols", [])]
-        for module in blocked_modules:
+        critical_symbols = workload.get("critical_symbols", [])
+        for module in workload.get("blocked_by", []):
             module_workload_ids[module].add(w_id)
             module_weighted_impact[module] += weight
             for symbol in critical_symbols:
@@ -104,20 +151,38 @@ def build_plan(
             module_to_beads[str(module)].append(str(bead))
 
     for module, beads in MODULE_BEAD_OVERRIDES.items():
-        merged = list(dict.fromkeys(module_to_beads.get(module, []) + beads))
-        module_to_beads[module] = merged
-
+        # Insertion-ordered dedup: milestone beads first, then overrides.
+        merged = dict.fromkeys(module_to_beads.get(module, ()))
+        merged.update(dict.fromkeys(beads))
+        module_to_beads[module] = list(merged)
+
+    # Severity depends only on (status, perf_class) and the workload factors
+    # only on module, so both are resolved once per distinct key rather than
+    # once per candidate row.
+    severity_by_class: dict[tuple[str, str], float] = {}
+    module_factors: dict[str, tuple[float, int, float, Counter[str], list[str]]] = {}
     symbol_rows: list[dict[str, Any]] = []
     for row in candidates:
-        symbol = str(row.get("symbol"))
-        module = str(row.get("module"))
-        status = str(row.get("status"))
-        perf_class = str(row.get("perf_class"))
-        sev = severity_weight(status, perf_class)
-        workload_weight = float(module_weighted_impact.get(module, 0.0))
-        blocked_count = len(module_workload_ids.get(module, set()))
-        critical_mentions = int(module_critical_symbols.get(module, Counter()).get(symbol, 0))
-        score = round(sev * (1.0 + workload_weight + (0.5 * critical_mentions)), 3)
+        symbol = row["symbol"]
+        module = row["module"]
+        status = row["status"]
+        perf_class = row["perf_class"]
+        sev = severity_by_class.get((status, perf_class))
+        if sev is None:
+            sev = severity_by_class[(status, perf_class)] = severity_weight(status, perf_class)
+        factors = module_factors.get(module)
+        if factors is None:
+            workload_weight = float(module_weighted_impact.get(module, 0.0))
+            factors = module_factors[module] = (
+                1.0 + workload_weight,
+                len(module_workload_ids.get(module, ())),
+                round(workload_weight, 3),
+                module_critical_symbols.get(module, _NO_CRITICAL_SYMBOLS),
+                module_to_beads.get(module, []),
+            )
+        base, blocked_count, rounded_weight, critical_counts, beads = factors
+        critical_mentions = int(critical_counts.get(symbol, 0))
+        score = round(sev * (base + (0.5 * critical_mentions)), 3)
 
         symbol_rows.append(
             {
@@ -127,21 +192,20 @@ def build_plan(
                 "perf_class": perf_class,
                 "severity_weight": sev,
                 "blocked_workloads": blocked_count,
-                "weighted_workload_impact": round(workload_weight, 3),
+                "weighted_workload_impact": rounded_weight,
                 "critical_symbol_mentions": critical_mentions,
                 "score": score,
                 "wave_id": symbol_to_wave.get(symbol, "unplanned"),
-                "recommended_beads": module_to_beads.get(module, []),
+                "recommended_beads": beads,
             }
         )
 
     symbol_rows.sort(key=lambda r: (-r["score"], r["module"], r["symbol"]))
 
-    top_symbol_rows = []
-    for rank, row in enumerate(symbol_rows[:top_n], start=1):
-        entry = dict(row)
-        entry["rank"] = rank
-        top_symbol_rows.append(entry)
+    # Rows are only read by field below, so ranking them in place is safe.
+    top_symbol_rows = symbol_rows[:top_n]
+    for rank, row in enumerate(top_symbol_rows, start=1):
+        row["rank"] = rank
     effective_top_n = len(top_symbol_rows)
 
     module_scores: dict[str, dict[str, Any]] = {}
@@ -170,17 +234,26 @@ def build_plan(
     for rank, row in enumerate(module_ranking, start=1):
         row["rank"] = rank
 
+    rows_by_symbol: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in symbol_rows:
+        rows_by_symbol[row["symbol"]].append(row)
+
     wave_plan = []
-    for wave in sorted(wave_rows, key=lambda w: int(w.get("wave", 0))):
+    for wave_number, wave in sorted(
+        ((int(wave.get("wave", 0)), wave) for wave in wave_rows), key=lambda pair: pair[0]
+    ):
         wave_id = str(wave.get("wave_id"))
-        wave_symbols = [s for s in wave.get("symbols", []) if s in {r["symbol"] for r in symbol_rows}]
-        scored = [r for r in symbol_rows if r["symbol"] in set(wave_symbols)]
+        scored = [
+            row
+            for symbol in dict.fromkeys(wave.get("symbols", []))
+            for row in rows_by_symbol.get(symbol, ())
+        ]
         scored.sort(key=lambda r: (-r["score"], r["symbol"]))
         modules = sorted({r["module"] for r in scored})
 
         wave_plan.append(
             {
-                "wave": int(wave.get("wave", 0)),
+                "wave": wave_number,
                 "wave_id": wave_id,
                 "title": wave.get("title"),
                 "depends_on": sorted(str(dep) for dep in wave.get("depends_on", [])),
@@ -206,24 +279,19 @@ def build_plan(
 
     top_blocker = module_ranking[0]["module"] if module_ranking else None
 
+    # hashlib releases the GIL while digesting large buffers, so the input
+    # hashes can overlap in threads.
+    with ThreadPoolExecutor(max_workers=len(INPUT_ARTIFACTS)) as pool:
+        input_digests = list(pool.map(sha256_file, (Path(path) for _, path in INPUT_ARTIFACTS)))
+
     return {
         "schema_version": "v1",
         "bead": "bd-3mam",
         "description": "Workload-ranked top-N API enablement wave plan from real workload blockers and support-matrix obligations.",
         "generated_utc": "2026-02-13T00:00:00Z",
         "inputs": {
-            "workload_matrix": {
-                "path": "tests/conformance/workload_matrix.json",
-                "sha256": sha256_file(Path("tests/conformance/workload_matrix.json")),
-            },
-            "support_matrix": {
-                "path": "support_matrix.json",
-                "sha256": sha256_file(Path("support_matrix.json")),
-            },
-            "callthrough_census": {
-                "path": "tests/conformance/callthrough_census.v1.json",
-                "sha256": sha256_file(Path("tests/conformance/callthrough_census.v1.json")),
-            },
+            name: {"path": path, "sha256": digest}
+            for (name, path), digest in zip(INPUT_ARTIFACTS, input_digests)
         },
         "scoring": {
             "priority_weights": PRIORITY_WEIGHTS,
@@ -274,9 +342,9 @@ def main() -> int:
     parser.add_argument("--check", action="store_true")
     args = parser.parse_args()
 
-    workload_matrix = load_json(args.workload_matrix)
-    support_matrix = load_json(args.support_matrix)
-    callthrough_census = load_json(args.callthrough_census)
+    workload_matrix = load_json_cached(args.workload_matrix)
+    support_matrix = load_json_cached(args.support_matrix)
+    callthrough_census = load_json_cached(args.callthrough_census)
 
     plan = build_plan(
         workload_matrix=workload_matrix,
@@ -285,13 +353,12 @@ def main() -> int:
         top_n=args.top_n,
     )
 
-    rendered = json.dumps(plan, indent=2, sort_keys=False) + "\n"
+    rendered = render_json(plan)
 
     if args.check:
         if not args.output.exists():
             raise SystemExit(f"ERROR: output artifact missing for --check: {args.output}")
-        current = args.output.read_text(encoding="utf-8")
-        if current != rendered:
+        if args.output.read_bytes() != rendered:
             raise SystemExit(
                 f"ERROR: workload API wave plan drift detected. regenerate with: {Path(__file__).name}"
             )
@@ -302,7 +369,7 @@ def main() -> int:
         return 0
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(rendered, encoding="utf-8")
+    args.output.write_bytes(rendered)
     print(
         f"Wrote {args.output} "
         f"(top_n={args.top_n}, candidates={plan['summary']['candidate_symbols']}, waves={plan['summary']['wave_count']})"
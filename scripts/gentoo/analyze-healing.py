@@ -5,68 +5,267 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from array import array
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Tuple
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
-def iter_log_lines(path: Path) -> Iterable[Tuple[Path, str]]:
-    if path.is_file():
-        for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-            yield path, line
+
+def _iter_file_lines(path: Path) -> Iterable[bytes]:
+    with path.open("rb") as handle:
+        yield from handle
+
+
+def _walk_jsonl(root: str) -> Iterator[str]:
+    # Like rglob("*.jsonl"): no descent into symlinked directories, and
+    # unreadable directories are skipped.
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_jsonl(entry.path)
+                elif entry.name.endswith(".jsonl"):
+                    yield entry.path
+    except PermissionError:
         return
-    for file_path in sorted(path.rglob("*.jsonl")):
-        for line in file_path.read_text(encoding="utf-8", errors="replace").splitlines():
+
+
+def log_files(path: Path) -> List[Path]:
+    """The JSONL files under ``path`` (or ``path`` itself), in analysis order."""
+    if path.is_file():
+        return [path]
+    # Sorting on split components matches Path ordering without building a
+    # Path for every candidate.
+    return [Path(p) for p in sorted(_walk_jsonl(os.fspath(path)), key=lambda p: p.split(os.sep))]
+
+
+def iter_log_lines(path: Path) -> Iterable[Tuple[Path, bytes]]:
+    """Yield raw (undecoded) lines one at a time without reading whole files."""
+    for file_path in log_files(path):
+        for line in _iter_file_lines(file_path):
             yield file_path, line
 
 
-def analyze(path: Path, top_n: int = 20) -> Dict[str, Any]:
-    action_counts: Counter[str] = Counter()
-    package_counts: Dict[str, Counter[str]] = defaultdict(Counter)
-    package_call_counts: Counter[str] = Counter()
-    call_site_counts: Counter[Tuple[str, str]] = Counter()
-    call_site_size_sums: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(lambda: {"original": 0.0, "clamped": 0.0, "n": 0.0})
+def parse_line(line: bytes) -> Any:
+    """Parse one JSONL record; raises ValueError when it is not valid JSON."""
+    try:
+        if orjson is not None:
+            payload = orjson.loads(line)
+            # orjson decodes integers wider than 64 bits as floats; records
+            # with a top-level float are re-parsed by the stdlib so such
+            # values stay exact ints. (Nested sizes are summed as floats
+            # either way.)
+            if not (isinstance(payload, dict) and float in map(type, payload.values())):
+                return payload
+        return json.loads(line)
+    except ValueError:
+        # Lines that are not valid UTF-8 are decoded leniently, as before.
+        return json.loads(line.decode("utf-8", errors="replace"))
 
-    parse_errors = 0
-    total_entries = 0
-    total_actions = 0
 
-    for _, line in iter_log_lines(path):
-        line = line.strip()
-        if not line:
-            continue
-        total_entries += 1
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            parse_errors += 1
-            continue
+@dataclass
+class SizeSums:
+    """Per-(call_site, action) size sums stored column-wise.
 
-        package = str(payload.get("package") or payload.get("atom") or "unknown")
-        call = str(payload.get("call") or payload.get("event") or "unknown")
-        package_call_counts[package] += 1 if call else 0
+    Keys map to a row index into three ``array('d')`` columns, so each key
+    costs three packed doubles instead of a dict of three floats.
+    """
 
-        action = payload.get("action")
-        if not action:
-            continue
-        action = str(action)
-        total_actions += 1
-        action_counts[action] += 1
-        package_counts[package][action] += 1
+    index: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    original: array = field(default_factory=lambda: array("d"))
+    clamped: array = field(default_factory=lambda: array("d"))
+    n: array = field(default_factory=lambda: array("d"))
 
-        call_site = str(payload.get("call_site") or payload.get("function") or call)
-        key = (call_site, action)
-        call_site_counts[key] += 1
+    def _row(self, key: Tuple[str, str]) -> int:
+        row = self.index.get(key)
+        if row is None:
+            row = self.index[key] = len(self.n)
+            self.original.append(0.0)
+            self.clamped.append(0.0)
+            self.n.append(0.0)
+        return row
 
+    def add(self, key: Tuple[str, str], payload: Dict[str, Any]) -> None:
         details = payload.get("action_details") if isinstance(payload.get("action_details"), dict) else {}
         if isinstance(details, dict):
+            row = self._row(key)
             original = details.get("original_size")
             clamped = details.get("clamped_size")
             if isinstance(original, (int, float)):
-                call_site_size_sums[key]["original"] += float(original)
+                self.original[row] += float(original)
             if isinstance(clamped, (int, float)):
-                call_site_size_sums[key]["clamped"] += float(clamped)
-            call_site_size_sums[key]["n"] += 1.0
+                self.clamped[row] += float(clamped)
+            self.n[row] += 1.0
+
+    def merge(self, other: "SizeSums") -> None:
+        for key, other_row in other.index.items():
+            row = self._row(key)
+            self.original[row] += other.original[other_row]
+            self.clamped[row] += other.clamped[other_row]
+            self.n[row] += other.n[other_row]
+
+    def get(self, key: Tuple[str, str]) -> Tuple[float, float, float]:
+        """(original, clamped, n) sums for ``key``; zeros when it was never seen."""
+        row = self.index.get(key)
+        if row is None:
+            return 0.0, 0.0, 0.0
+        return self.original[row], self.clamped[row], self.n[row]
+
+
+def sum_call_site_sizes(lines: Iterable[bytes], keys: FrozenSet[Tuple[str, str]]) -> SizeSums:
+    """Second low-memory pass: size sums for the given (call_site, action) keys only."""
+    call_site_size_sums = SizeSums()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = parse_line(line)
+        except ValueError:
+            continue
+        action = payload.get("action")
+        if not action:
+            continue
+        call = str(payload.get("call") or payload.get("event") or "unknown")
+        key = (str(payload.get("call_site") or payload.get("function") or call), str(action))
+        if key in keys:
+            call_site_size_sums.add(key, payload)
+    return call_site_size_sums
+
+
+@dataclass
+class HealingTally:
+    """Mergeable per-shard accumulators behind an analyze() summary."""
+
+    # Keyed by (package, action); split into per-action and per-package
+    # breakdowns once, after all lines are tallied.
+    package_action_counts: Counter[Tuple[str, str]] = field(default_factory=Counter)
+    package_call_counts: Counter[str] = field(default_factory=Counter)
+    call_site_counts: Counter[Tuple[str, str]] = field(default_factory=Counter)
+    call_site_size_sums: SizeSums = field(default_factory=SizeSums)
+    parse_errors: int = 0
+    total_entries: int = 0
+    total_actions: int = 0
+    # False skips size sums entirely (the first pass of a low-memory analyze).
+    track_sizes: bool = True
+
+    def add_lines(self, lines: Iterable[bytes]) -> None:
+        package_action_counts = self.package_action_counts
+        package_call_counts = self.package_call_counts
+        call_site_counts = self.call_site_counts
+        add_sizes = self.call_site_size_sums.add
+        track_sizes = self.track_sizes
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            self.total_entries += 1
+            try:
+                payload = parse_line(line)
+            except ValueError:
+                self.parse_errors += 1
+                continue
+
+            package = str(payload.get("package") or payload.get("atom") or "unknown")
+            call = str(payload.get("call") or payload.get("event") or "unknown")
+            package_call_counts[package] += 1 if call else 0
+
+            action = payload.get("action")
+            if not action:
+                continue
+            action = str(action)
+            self.total_actions += 1
+            package_action_counts[(package, action)] += 1
+
+            call_site = str(payload.get("call_site") or payload.get("function") or call)
+            key = (call_site, action)
+            call_site_counts[key] += 1
+
+            if track_sizes:
+                add_sizes(key, payload)
+
+    def merge(self, other: "HealingTally") -> None:
+        # Merging shards in file order keeps first-seen key order (and so
+        # most_common tie order) identical to a single serial pass.
+        self.package_action_counts.update(other.package_action_counts)
+        self.package_call_counts.update(other.package_call_counts)
+        self.call_site_counts.update(other.call_site_counts)
+        self.call_site_size_sums.merge(other.call_site_size_sums)
+        self.parse_errors += other.parse_errors
+        self.total_entries += other.total_entries
+        self.total_actions += other.total_actions
+
+    def split_counts(self) -> Tuple[Counter[str], Dict[str, Counter[str]]]:
+        """Return (action_counts, package_counts) in first-seen order."""
+        action_counts: Counter[str] = Counter()
+        package_counts: Dict[str, Counter[str]] = defaultdict(Counter)
+        for (package, action), count in self.package_action_counts.items():
+            action_counts[action] += count
+            package_counts[package][action] = count
+        return action_counts, package_counts
+
+
+def tally_file(path: Path, track_sizes: bool = True) -> HealingTally:
+    tally = HealingTally(track_sizes=track_sizes)
+    tally.add_lines(_iter_file_lines(path))
+    return tally
+
+
+def sum_file_sizes(path: Path, keys: FrozenSet[Tuple[str, str]]) -> SizeSums:
+    return sum_call_site_sizes(_iter_file_lines(path), keys)
+
+
+def analyze(path: Path, top_n: int = 20, jobs: int = 1, low_memory: bool = False) -> Dict[str, Any]:
+    """Summarize healing actions under ``path``.
+
+    With ``jobs > 1`` and several log files, files are tallied in a process
+    pool and merged in file order; the summary is identical to a serial run.
+
+    ``low_memory`` skips per-call-site size sums on the first pass and re-reads
+    the logs to sum sizes for the top ``top_n`` call sites only. The summary is
+    identical; peak memory no longer carries size sums for every call site, at
+    the cost of parsing the logs twice.
+    """
+    files = log_files(path)
+    parallel = jobs > 1 and len(files) > 1
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(files))) if parallel else None
+    try:
+        tally = HealingTally(track_sizes=not low_memory)
+        if pool is not None:
+            for part in pool.map(partial(tally_file, track_sizes=not low_memory), files):
+                tally.merge(part)
+        else:
+            for file_path in files:
+                tally.add_lines(_iter_file_lines(file_path))
+
+        if low_memory:
+            top_keys = frozenset(key for key, _ in tally.call_site_counts.most_common(top_n))
+            parts = (
+                pool.map(partial(sum_file_sizes, keys=top_keys), files)
+                if pool is not None
+                else (sum_file_sizes(file_path, top_keys) for file_path in files)
+            )
+            for part in parts:
+                tally.call_site_size_sums.merge(part)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    action_counts, package_counts = tally.split_counts()
+    package_call_counts = tally.package_call_counts
+    call_site_counts = tally.call_site_counts
+    call_site_size_sums = tally.call_site_size_sums
+    total_actions = tally.total_actions
 
     by_package = {}
     for package, breakdown in sorted(package_counts.items()):
@@ -80,21 +279,20 @@ def analyze(path: Path, top_n: int = 20) -> Dict[str, Any]:
 
     top_call_sites = []
     for (call_site, action), frequency in call_site_counts.most_common(top_n):
-        sums = call_site_size_sums[(call_site, action)]
-        n = sums["n"] or 0.0
+        original, clamped, n = call_site_size_sums.get((call_site, action))
         top_call_sites.append(
             {
                 "call_site": call_site,
                 "healing_action": action,
                 "frequency": frequency,
-                "original_size_avg": round(sums["original"] / n, 2) if n else None,
-                "clamped_size_avg": round(sums["clamped"] / n, 2) if n else None,
+                "original_size_avg": round(original / n, 2) if n else None,
+                "clamped_size_avg": round(clamped / n, 2) if n else None,
             }
         )
 
     return {
         "source": str(path),
-        "total_entries": total_entries,
+        "total_entries": tally.total_entries,
         "total_healing_actions": total_actions,
         "actions_per_1000_calls": round((total_actions / sum(package_call_counts.values())) * 1000.0, 2)
         if sum(package_call_counts.values())
@@ -102,7 +300,7 @@ def analyze(path: Path, top_n: int = 20) -> Dict[str, Any]:
         "breakdown": dict(action_counts),
         "by_package": by_package,
         "top_call_sites": top_call_sites,
-        "parse_errors": parse_errors,
+        "parse_errors": tally.parse_errors,
     }
 
 
@@ -111,6 +309,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("source", help="Path to .jsonl file or root directory")
     parser.add_argument("--output", help="Write summary JSON to this file")
     parser.add_argument("--top", type=int, default=20, help="Top call-site/action rows")
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Keep size sums only for the top call sites (parses the logs twice)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for multi-file sources (default: CPU count; 1 = serial)",
+    )
     return parser.parse_args()
 
 
@@ -120,7 +329,7 @@ def main() -> int:
     if not source.exists():
         raise SystemExit(f"missing source path: {source}")
 
-    summary = analyze(source, top_n=args.top)
+    summary = analyze(source, top_n=args.top, jobs=args.jobs, low_memory=args.low_memory)
     rendered = json.dumps(summary, indent=2, sort_keys=True)
     if args.output:
         output = Path(args.output)
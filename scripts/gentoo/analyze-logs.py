@@ -4,25 +4,70 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import io
 import json
-from collections import Counter
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
-def _record_from_line(line: str) -> Dict[str, Any] | None:
-    line = line.strip()
-    if not line:
+
+def _inexact(payload: Any) -> bool:
+    # orjson decodes integers wider than 64 bits as floats; records with a
+    # top-level float are re-parsed by the stdlib so such values stay exact.
+    return isinstance(payload, dict) and float in map(type, payload.values())
+
+
+def _loads(line: bytes) -> Any:
+    if orjson is not None:
+        try:
+            payload = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # NaN, lone surrogates and invalid UTF-8 are still accepted by
+            # the stdlib parser below.
+            pass
+        else:
+            if not _inexact(payload):
+                return payload
+    return json.loads(line.decode("utf-8", errors="replace"))
+
+
+def _record_from_line(raw: bytes) -> Dict[str, Any] | None:
+    # Fast path for well-formed JSONL: orjson skips the surrounding
+    # whitespace itself, so no stripped copy is made. Anything it rejects
+    # takes the general path below.
+    if orjson is not None and raw[:1] == b"{":
+        try:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if isinstance(payload, dict) and not _inexact(payload):
+                return payload
+
+    raw = raw.strip()
+    if not raw:
         return None
 
-    if line.startswith("{"):
+    if raw.startswith(b"{"):
         try:
-            payload = json.loads(line)
+            payload = _loads(raw)
             if isinstance(payload, dict):
                 return payload
-        except json.JSONDecodeError:
+        except ValueError:
             return None
 
+    line = raw.decode("utf-8", errors="replace")
     # Backward-compatible fallback for old text hook logs:
     # "timestamp atom=x phase=y msg=z".
     record: Dict[str, Any] = {}
@@ -43,31 +88,98 @@ def _record_from_line(line: str) -> Dict[str, Any] | None:
     return None
 
 
-def _iter_log_files(root: Path) -> Iterable[Path]:
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        if path.suffix in {".jsonl", ".log"}:
-            yield path
-
-
-def analyze(root: Path, top_n: int) -> Dict[str, Any]:
-    event_counts: Counter[str] = Counter()
-    phase_counts: Counter[str] = Counter()
-    atom_counts: Counter[str] = Counter()
-    call_counts: Counter[str] = Counter()
-    action_counts: Counter[str] = Counter()
-
-    files_scanned = 0
-    lines_total = 0
-    records_total = 0
-    parse_errors = 0
-    latency_values: list[int] = []
-
-    for log_file in _iter_log_files(root):
-        files_scanned += 1
-        with log_file.open("r", encoding="utf-8", errors="replace") as fh:
-            for raw_line in fh:
+def _has_log_suffix(name: str) -> bool:
+    # Path.suffix semantics: a bare ".log" has no suffix.
+    return (name.endswith(".jsonl") and len(name) > 6) or (name.endswith(".log") and len(name) > 4)
+
+
+def _walk_log_files(root: str) -> Iterable[str]:
+    # Like rglob("*"): no descent into symlinked directories, unreadable
+    # directories are skipped, and is_file() follows symlinks to files.
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_log_files(entry.path)
+                elif _has_log_suffix(entry.name) and entry.is_file():
+                    yield entry.path
+    except PermissionError:
+        return
+
+
+def _iter_log_files(root: Path) -> Iterable[str]:
+    # Sorting on split components matches the previous sorted(Path) order.
+    return sorted(_walk_log_files(os.fspath(root)), key=lambda p: p.split(os.sep))
+
+
+def _top(counts: Dict[str, int], top_n: int) -> list[tuple[str, int]]:
+    # Same selection and tie order as Counter.most_common(top_n).
+    return heapq.nlargest(top_n, counts.items(), key=itemgetter(1))
+
+
+# Log files larger than this are tallied in line-aligned byte ranges of about
+# this size, so one huge log still spreads across the worker pool.
+LOG_CHUNK_BYTES = 32 * 1024 * 1024
+
+
+def _split_log_file(log_file: str, size: int, chunk_bytes: int) -> list[tuple[int, int]]:
+    """Cut ``log_file`` into [start, end) byte ranges that begin at line starts."""
+    spans: list[tuple[int, int]] = []
+    start = 0
+    with open(log_file, "rb") as fh:
+        while size - start > chunk_bytes:
+            fh.seek(start + chunk_bytes)
+            fh.readline()
+            end = fh.tell()
+            if end >= size:
+                break
+            spans.append((start, end))
+            start = end
+    spans.append((start, size))
+    return spans
+
+
+def _count_field() -> Dict[str, int]:
+    return defaultdict(int)
+
+
+@dataclass
+class LogTally:
+    """Mergeable per-file accumulators behind an analyze() summary."""
+
+    event_counts: Dict[str, int] = field(default_factory=_count_field)
+    phase_counts: Dict[str, int] = field(default_factory=_count_field)
+    atom_counts: Dict[str, int] = field(default_factory=_count_field)
+    call_counts: Dict[str, int] = field(default_factory=_count_field)
+    action_counts: Dict[str, int] = field(default_factory=_count_field)
+    files_scanned: int = 0
+    lines_total: int = 0
+    records_total: int = 0
+    parse_errors: int = 0
+    latency_count: int = 0
+    latency_sum: int = 0
+    latency_min: int | None = None
+    latency_max: int | None = None
+
+    def add_file(self, log_file: str, span: tuple[int, int] | None = None) -> None:
+        """Tally ``log_file``, or only its line-aligned ``span`` byte range."""
+        event_counts = self.event_counts
+        phase_counts = self.phase_counts
+        atom_counts = self.atom_counts
+        call_counts = self.call_counts
+        action_counts = self.action_counts
+
+        lines_total = records_total = parse_errors = 0
+        latency_count = latency_sum = 0
+        latency_min: int | None = None
+        latency_max: int | None = None
+        with open(log_file, "rb") as fh:
+            lines: Iterable[bytes] = fh
+            if span is not None:
+                start, end = span
+                fh.seek(start)
+                lines = io.BytesIO(fh.read(end - start))
+            for raw_line in lines:
                 lines_total += 1
                 record = _record_from_line(raw_line)
                 if record is None:
@@ -89,62 +201,170 @@ def analyze(root: Path, top_n: int) -> Dict[str, Any]:
 
                 latency = record.get("latency_ns")
                 if isinstance(latency, int):
-                    latency_values.append(latency)
+                    latency_count += 1
+                    latency_sum += latency
+                    if latency_min is None or latency < latency_min:
+                        latency_min = latency
+                    if latency_max is None or latency > latency_max:
+                        latency_max = latency
+
+        if span is None or span[0] == 0:
+            self.files_scanned += 1
+        self.lines_total += lines_total
+        self.records_total += records_total
+        self.parse_errors += parse_errors
+        if latency_count:
+            self._add_latency(latency_count, latency_sum, latency_min, latency_max)
+
+    def _add_latency(self, count: int, total: int, low: int, high: int) -> None:
+        self.latency_count += count
+        self.latency_sum += total
+        # Strict comparisons keep the first extreme seen, as min()/max() do.
+        if self.latency_min is None or low < self.latency_min:
+            self.latency_min = low
+        if self.latency_max is None or high > self.latency_max:
+            self.latency_max = high
+
+    def merge(self, other: "LogTally") -> None:
+        # Merging in file order keeps first-seen key order (and so top-N tie
+        # order) identical to a single serial pass.
+        for mine, theirs in (
+            (self.event_counts, other.event_counts),
+            (self.phase_counts, other.phase_counts),
+            (self.atom_counts, other.atom_counts),
+            (self.call_counts, other.call_counts),
+            (self.action_counts, other.action_counts),
+        ):
+            for key, count in theirs.items():
+                mine[key] += count
+        self.files_scanned += other.files_scanned
+        self.lines_total += other.lines_total
+        self.records_total += other.records_total
+        self.parse_errors += other.parse_errors
+        if other.latency_count:
+            self._add_latency(other.latency_count, other.latency_sum, other.latency_min, other.latency_max)
+
+
+def tally_file(log_file: str, span: tuple[int, int] | None = None) -> LogTally:
+    tally = LogTally()
+    tally.add_file(log_file, span)
+    return tally
+
+
+def _plan_tasks(files: list[str], chunk_bytes: int) -> tuple[list[str], list[tuple[int, int] | None]]:
+    # Pre-stat every file; only oversized ones are split, in file order.
+    paths: list[str] = []
+    spans: list[tuple[int, int] | None] = []
+    for log_file in files:
+        try:
+            size = os.stat(log_file).st_size
+        except OSError:
+            size = 0
+        if size > chunk_bytes:
+            for span in _split_log_file(log_file, size, chunk_bytes):
+                paths.append(log_file)
+                spans.append(span)
+        else:
+            paths.append(log_file)
+            spans.append(None)
+    return paths, spans
+
+
+def analyze(root: Path, top_n: int, jobs: int = 1) -> Dict[str, Any]:
+    """Summarize the JSONL/legacy logs under ``root``.
+
+    With ``jobs > 1``, files (and line-aligned ranges of files over
+    LOG_CHUNK_BYTES) are tallied in a process pool and merged in file order;
+    the summary is identical to a serial run.
+    """
+    files = _iter_log_files(root)
+    tally = LogTally()
+    paths, spans = _plan_tasks(files, LOG_CHUNK_BYTES) if jobs > 1 else (files, [])
+    if jobs > 1 and len(paths) > 1:
+        # Ranges of a split file are large; hand them out one at a time.
+        chunksize = 8 if len(paths) == len(files) else 1
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+            for part in pool.map(tally_file, paths, spans, chunksize=chunksize):
+                tally.merge(part)
+    else:
+        for log_file in files:
+            tally.add_file(log_file)
 
     latency_summary: Dict[str, Any]
-    if latency_values:
+    if tally.latency_count:
         latency_summary = {
-            "count": len(latency_values),
-            "min": min(latency_values),
-            "max": max(latency_values),
-            "avg": int(sum(latency_values) / len(latency_values)),
+            "count": tally.latency_count,
+            "min": tally.latency_min,
+            "max": tally.latency_max,
+            "avg": int(tally.latency_sum / tally.latency_count),
         }
     else:
         latency_summary = {"count": 0}
 
     return {
         "root": str(root),
-        "files_scanned": files_scanned,
-        "lines_total": lines_total,
-        "records_total": records_total,
-        "parse_errors": parse_errors,
-        "events": dict(event_counts),
-        "phases": dict(phase_counts),
-        "top_atoms": atom_counts.most_common(top_n),
-        "top_calls": call_counts.most_common(top_n),
-        "top_actions": action_counts.most_common(top_n),
+        "files_scanned": tally.files_scanned,
+        "lines_total": tally.lines_total,
+        "records_total": tally.records_total,
+        "parse_errors": tally.parse_errors,
+        "events": dict(tally.event_counts),
+        "phases": dict(tally.phase_counts),
+        "top_atoms": _top(tally.atom_counts, top_n),
+        "top_calls": _top(tally.call_counts, top_n),
+        "top_actions": _top(tally.action_counts, top_n),
         "latency_ns": latency_summary,
     }
 
 
+def render_json(summary: Dict[str, Any]) -> bytes:
+    """Key-sorted, 2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        except orjson.JSONEncodeError:
+            # orjson cannot encode ints wider than 64 bits (exact values
+            # from the stdlib fallback in _loads()) or lone surrogates.
+            pass
+    text = json.dumps(summary, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    # Lone surrogates become their JSON \uXXXX escape; everything else is UTF-8.
+    return text.encode("utf-8", errors="backslashreplace")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Analyze FrankenLibC Portage log trees.")
     parser.add_argument("root", nargs="?", default="/var/log/frankenlibc", help="Log root directory")
     parser.add_argument("--output", help="Write JSON summary to file")
     parser.add_argument("--top", type=int, default=10, help="Top-N list size")
     parser.add_argument("--json-only", action="store_true", help="Print only JSON summary")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for multi-file trees (default: CPU count; 1 = serial)",
+    )
     args = parser.parse_args()
 
     root = Path(args.root)
     if not root.exists():
         raise SystemExit(f"Log root does not exist: {root}")
 
-    summary = analyze(root, args.top)
-    payload = json.dumps(summary, indent=2, sort_keys=True)
+    summary = analyze(root, args.top, jobs=args.jobs)
+    payload = render_json(summary)
 
     if args.output:
         out = Path(args.output)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(payload + "\n", encoding="utf-8")
+        out.write_bytes(payload)
 
-    if args.json_only:
-        print(payload)
-    else:
+    if not args.json_only:
         print(f"root={summary['root']}")
         print(f"files_scanned={summary['files_scanned']}")
         print(f"records_total={summary['records_total']}")
         print(f"parse_errors={summary['parse_errors']}")
-        print(payload)
+        sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
 
     return 0
 
@@ -16,18 +16,49 @@ import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import Any, Dict, Iterable, List, Set
 
 try:
     import tomllib  # py3.11+
 except ModuleNotFoundError:  # pragma: no cover
     import tomli as tomllib  # type: ignore
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+_NO_DEPENDENCIES: frozenset[str] = frozenset()
+
+# Attempt outcomes worth another try when retries remain.
+_RETRYABLE_RESULTS = frozenset({"failed", "timeout", "oom", "transient"})
+
+# Failure markers (OOM, network flakes) show up where the build died, so
+# only this much of the end of a build log is scanned.
+FAILURE_LOG_TAIL_BYTES = 256 * 1024
+
+# Completed builds rewrite the state file at most this often; each wave and
+# run() exit flush whatever is still pending.
+STATE_SAVE_INTERVAL_SECONDS = 2.0
+
+
+# (epoch second, formatted timestamp) of the last utc_now() call. Swapped as
+# one tuple so concurrent build threads always read a consistent pair.
+_utc_now_cache: tuple[int, str] = (-1, "")
+
 
 def utc_now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    global _utc_now_cache
+    second = int(time.time())
+    cached_second, text = _utc_now_cache
+    if second != cached_second:
+        # Timestamps have one-second resolution, so everything stamped
+        # within the same second (skips, saves, results) shares one format.
+        text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _utc_now_cache = (second, text)
+    return text
 
 
 def sanitize_atom(atom: str) -> str:
@@ -108,10 +139,45 @@ class PackageResult:
     reason: str = ""
 
 
+# metadata.json is written by build-package.sh, which emits these as JSON
+# strings, so they are taken as-is; only the numeric fields are coerced.
+_METADATA_STR_FIELDS = (
+    "version",
+    "result",
+    "frankenlibc_mode",
+    "log_file",
+    "frankenlibc_log",
+    "binary_package",
+    "timestamp",
+    "reason",
+)
+_METADATA_INT_FIELDS = ("build_time_seconds", "frankenlibc_healing_actions", "exit_code")
+
+
+def _coerce_result(package: str, attempt: int, payload: Dict[str, Any], defaults: Dict[str, Any]) -> PackageResult:
+    """Build a PackageResult from container metadata, falling back to ``defaults``."""
+    values: Dict[str, Any] = {name: payload.get(name, defaults[name]) for name in _METADATA_STR_FIELDS}
+    for name in _METADATA_INT_FIELDS:
+        values[name] = int(payload.get(name, defaults[name]))
+    return PackageResult(package=package, attempts=attempt, **values)
+
+
+def load_json_bytes(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class BuildRunner:
     def __init__(self, config: BuildConfig) -> None:
         self.config = config
         self.results: Dict[str, PackageResult] = {}
+        # Packages whose recorded result is "success"; kept in step with
+        # self.results by _record so dependency checks are a subset test.
+        self._succeeded: Set[str] = set()
+        # Results recorded since the last state write, and when that was.
+        self._dirty = False
+        self._last_save = float("-inf")
         self.order = self._load_build_order()
         self.dependencies = self._load_dependencies()
         self.waves = self._load_waves()
@@ -149,7 +215,24 @@ class BuildRunner:
             return
         payload = json.loads(self.config.state_file.read_text(encoding="utf-8"))
         for package, record in payload.get("results", {}).items():
-            self.results[package] = PackageResult(**record)
+            self._record(package, PackageResult(**record))
+
+    def _record(self, package: str, result: PackageResult) -> None:
+        self.results[package] = result
+        if result.result == "success":
+            self._succeeded.add(package)
+        else:
+            self._succeeded.discard(package)
+
+    def _maybe_save_state(self, min_interval: float = STATE_SAVE_INTERVAL_SECONDS) -> None:
+        """Mark state dirty; rewrite it only if the last write is older than min_interval."""
+        self._dirty = True
+        if time.monotonic() - self._last_save >= min_interval:
+            self._save_state()
+
+    def _flush_state(self) -> None:
+        if self._dirty:
+            self._save_state()
 
     def _save_state(self) -> None:
         self.config.state_file.parent.mkdir(parents=True, exist_ok=True)
@@ -157,16 +240,18 @@ class BuildRunner:
             "updated_at": utc_now(),
             "results": {pkg: asdict(res) for pkg, res in sorted(self.results.items())},
         }
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
         tmp = self.config.state_file.with_suffix(".tmp")
-        tmp.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.write_bytes(data)
         tmp.replace(self.config.state_file)
+        self._dirty = False
+        self._last_save = time.monotonic()
 
     def _is_dependency_satisfied(self, package: str) -> bool:
-        for dep in self.dependencies.get(package, set()):
-            result = self.results.get(dep)
-            if result is None or result.result != "success":
-                return False
-        return True
+        return self.dependencies.get(package, _NO_DEPENDENCIES).issubset(self._succeeded)
 
     def _skip_due_to_dependency(self, package: str) -> PackageResult:
         return PackageResult(
@@ -189,10 +274,13 @@ class BuildRunner:
         if exit_code == 124:
             return "timeout"
         if build_log.exists():
-            body = build_log.read_text(encoding="utf-8", errors="ignore").lower()
-            if "cannot allocate memory" in body or "out of memory" in body or "oom" in body:
+            with build_log.open("rb") as fh:
+                size = fh.seek(0, os.SEEK_END)
+                fh.seek(max(0, size - FAILURE_LOG_TAIL_BYTES))
+                tail = fh.read().lower()
+            if b"cannot allocate memory" in tail or b"out of memory" in tail or b"oom" in tail:
                 return "oom"
-            if "connection timed out" in body or "temporary failure" in body:
+            if b"connection timed out" in tail or b"temporary failure" in tail:
                 return "transient"
         return "failed"
 
@@ -247,23 +335,25 @@ class BuildRunner:
 
         elapsed = int(time.time() - started)
         if metadata_path.exists():
-            payload = json.loads(metadata_path.read_text(encoding="utf-8"))
-            result = PackageResult(
-                package=package,
-                version=str(payload.get("version", "")),
-                result=str(payload.get("result", "failed")),
-                build_time_seconds=int(payload.get("build_time_seconds", elapsed)),
-                frankenlibc_healing_actions=int(payload.get("frankenlibc_healing_actions", 0)),
-                frankenlibc_mode=str(payload.get("frankenlibc_mode", self.config.mode)),
-                log_file=str(payload.get("log_file", attempt_dir / "build.log")),
-                frankenlibc_log=str(payload.get("frankenlibc_log", attempt_dir / "frankenlibc.jsonl")),
-                binary_package=str(payload.get("binary_package", "")),
-                exit_code=int(payload.get("exit_code", proc.returncode)),
-                timestamp=str(payload.get("timestamp", utc_now())),
-                attempts=attempt,
-                reason=str(payload.get("reason", "")),
+            payload = load_json_bytes(metadata_path.read_bytes())
+            return _coerce_result(
+                package,
+                attempt,
+                payload,
+                {
+                    "version": "",
+                    "result": "failed",
+                    "build_time_seconds": elapsed,
+                    "frankenlibc_healing_actions": 0,
+                    "frankenlibc_mode": self.config.mode,
+                    "log_file": str(attempt_dir / "build.log"),
+                    "frankenlibc_log": str(attempt_dir / "frankenlibc.jsonl"),
+                    "binary_package": "",
+                    "exit_code": proc.returncode,
+                    "timestamp": utc_now(),
+                    "reason": "",
+                },
             )
-            return result
 
         build_log = attempt_dir / "build.log"
         result_kind = "success" if proc.returncode == 0 else self._classify_failure(proc.returncode, build_log)
@@ -291,7 +381,7 @@ class BuildRunner:
             last_result = result
             if result.result == "success":
                 return result
-            if attempt < attempts and result.result in {"failed", "timeout", "oom", "transient"}:
+            if attempt < attempts and result.result in _RETRYABLE_RESULTS:
                 time.sleep(min(5, attempt))
                 continue
             return result
@@ -302,33 +392,39 @@ class BuildRunner:
         self.config.results_dir.mkdir(parents=True, exist_ok=True)
         self._load_state()
 
-        for wave in self.waves:
-            pending = [pkg for pkg in wave if pkg not in self.results]
-            if not pending:
-                continue
-
-            buildable: List[str] = []
-            for package in pending:
-                if not self._is_dependency_satisfied(package):
-                    skipped = self._skip_due_to_dependency(package)
-                    self.results[package] = skipped
-                    self._save_state()
-                else:
-                    buildable.append(package)
-
-            if not buildable:
-                continue
-
-            workers = max(1, min(self.config.parallelism, len(buildable)))
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = {executor.submit(self._build_package, pkg): pkg for pkg in buildable}
-                for future in as_completed(futures):
-                    package = futures[future]
-                    result = future.result()
-                    self.results[package] = result
-                    self._save_state()
-                    if self.config.stop_on_failure and result.result != "success":
-                        raise RuntimeError(f"Stopping on failure: {package} -> {result.result}")
+        try:
+            results = self.results
+            is_satisfied = self._is_dependency_satisfied
+            for wave in self.waves:
+                buildable: List[str] = []
+                skipped_any = False
+                for package in wave:
+                    if package in results:
+                        continue
+                    if is_satisfied(package):
+                        buildable.append(package)
+                    else:
+                        self._record(package, self._skip_due_to_dependency(package))
+                        skipped_any = True
+                if skipped_any:
+                    self._maybe_save_state()
+
+                if buildable:
+                    workers = max(1, min(self.config.parallelism, len(buildable)))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = {executor.submit(self._build_package, pkg): pkg for pkg in buildable}
+                        for future in as_completed(futures):
+                            package = futures[future]
+                            result = future.result()
+                            self._record(package, result)
+                            self._maybe_save_state()
+                            if self.config.stop_on_failure and result.result != "success":
+                                raise RuntimeError(f"Stopping on failure: {package} -> {result.result}")
+
+                # Later waves depend on this one; persist it fully first.
+                self._flush_state()
+        finally:
+            self._flush_state()
 
         return self.results
 
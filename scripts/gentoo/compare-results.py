@@ -8,13 +8,25 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def load_json(path: Path) -> Any:
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def compare_results(baseline: Dict[str, Any], instrumented: Dict[str, Any]) -> Dict[str, Any]:
-    base_failed = set(baseline.get("failed_tests", []))
-    inst_failed = set(instrumented.get("failed_tests", []))
+    base_failed = frozenset(baseline.get("failed_tests", []))
+    inst_failed = frozenset(instrumented.get("failed_tests", []))
 
-    new_failures = sorted(inst_failed - base_failed)
-    new_passes = sorted(base_failed - inst_failed)
+    new_failures = sorted(inst_failed.difference(base_failed))
+    new_passes = sorted(base_failed.difference(inst_failed))
 
     base_duration = float(baseline.get("duration_seconds", 0.0))
     inst_duration = float(instrumented.get("duration_seconds", 0.0))
@@ -49,8 +61,8 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
-    instrumented = json.loads(Path(args.instrumented).read_text(encoding="utf-8"))
+    baseline = load_json(Path(args.baseline))
+    instrumented = load_json(Path(args.instrumented))
     comparison = compare_results(baseline, instrumented)
 
     rendered = json.dumps(comparison, indent=2, sort_keys=True)
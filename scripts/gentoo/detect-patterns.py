@@ -4,7 +4,10 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -46,9 +49,15 @@ def detect_patterns(summary: Dict[str, Any], top_n: int = 20) -> List[Dict[str,
     by_package = summary.get("by_package", {})
     patterns: List[Dict[str, Any]] = []
 
-    for action, total in sorted(breakdown.items(), key=lambda kv: kv[1], reverse=True)[:top_n]:
+    # One pass over the packages instead of one per reported action.
+    action_to_packages: Dict[str, List[str]] = defaultdict(list)
+    for pkg, pkg_data in by_package.items():
+        for action in pkg_data.get("breakdown", {}):
+            action_to_packages[action].append(pkg)
+
+    for action, total in heapq.nlargest(top_n, breakdown.items(), key=itemgetter(1)):
         meta = PATTERN_MAP.get(action, {"pattern": "unclassified healing behavior", "potential_cve_prevention": False})
-        packages = [pkg for pkg, pkg_data in by_package.items() if action in pkg_data.get("breakdown", {})]
+        packages = action_to_packages.get(action, [])
         patterns.append(
             {
                 "healing_action": action,
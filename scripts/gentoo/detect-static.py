@@ -6,31 +6,203 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+# Obvious text/config/source files and Rust library archives are never ELF binaries.
+_SKIP_SUFFIXES = frozenset(
+    {".json", ".md", ".txt", ".toml", ".yaml", ".yml", ".sh", ".py", ".rs", ".c", ".h", ".cc", ".hpp", ".rlib"}
+)
 
-def inspect_file(path: Path) -> dict[str, Any]:
-    proc = subprocess.run(
-        ["file", "-b", str(path)],
-        check=False,
-        capture_output=True,
-        text=True,
+ELF_MAGIC = b"\x7fELF"
+ET_EXEC, ET_DYN = 2, 3
+PT_DYNAMIC, PT_INTERP = 2, 3
+DT_NULL, DT_NEEDED, DT_FLAGS_1 = 0, 1, 0x6FFFFFFB
+DF_1_PIE = 0x08000000
+
+# Only this much of the dynamic section is scanned for DT_NEEDED/DT_FLAGS_1.
+_DYNAMIC_READ_LIMIT = 64 * 1024
+
+# (EI_CLASS, EI_DATA) -> (ELF header after e_ident, program header, dynamic
+# entry, index of p_offset, index of p_filesz).
+_ELF_LAYOUTS: dict[tuple[int, int], tuple[struct.Struct, struct.Struct, struct.Struct, int, int]] = {}
+for _ei_data, _order in ((1, "<"), (2, ">")):
+    _ELF_LAYOUTS[1, _ei_data] = (
+        struct.Struct(_order + "HHIIIIIHHHHHH"),
+        struct.Struct(_order + "IIIIIIII"),
+        struct.Struct(_order + "II"),
+        1,
+        4,
+    )
+    _ELF_LAYOUTS[2, _ei_data] = (
+        struct.Struct(_order + "HHIQQQIHHHHHH"),
+        struct.Struct(_order + "IIQQQQQQ"),
+        struct.Struct(_order + "QQ"),
+        2,
+        5,
     )
-    desc = proc.stdout.strip() if proc.stdout else ""
-    is_elf = "ELF" in desc
-    is_static = is_elf and "statically linked" in desc
-    is_dynamic = is_elf and "dynamically linked" in desc
+
+
+def _elf_linking(fd: int, header: bytes) -> str | None:
+    """Return "static" or "dynamic" for ELF executables and shared objects.
+
+    Anything else (relocatable objects, core files, unknown classes, headers
+    that do not parse) gives None.
+    """
+    layout = _ELF_LAYOUTS.get((header[4], header[5])) if len(header) > 5 else None
+    if layout is None:
+        return None
+    ehdr, phdr, dyn, offset_index, filesz_index = layout
+    if len(header) < 16 + ehdr.size:
+        return None
+    fields = ehdr.unpack_from(header, 16)
+    e_type, e_phoff, e_phentsize, e_phnum = fields[0], fields[4], fields[8], fields[9]
+    if e_type not in (ET_EXEC, ET_DYN) or e_phnum == 0 or e_phentsize != phdr.size:
+        return None
+
+    table = os.pread(fd, e_phnum * e_phentsize, e_phoff)
+    has_interp = False
+    dynamic: tuple[int, int] | None = None
+    for entry in phdr.iter_unpack(table[: len(table) - len(table) % phdr.size]):
+        if entry[0] == PT_INTERP:
+            has_interp = True
+        elif entry[0] == PT_DYNAMIC:
+            dynamic = (entry[offset_index], entry[filesz_index])
+    if dynamic is None:
+        return "static"
+    if has_interp:
+        return "dynamic"
+
+    # No interpreter: a static-pie carries DF_1_PIE and needs no libraries;
+    # anything else with a dynamic section is a shared object.
+    data = os.pread(fd, min(dynamic[1], _DYNAMIC_READ_LIMIT), dynamic[0])
+    pie = False
+    for tag, value in dyn.iter_unpack(data[: len(data) - len(data) % dyn.size]):
+        if tag == DT_NULL:
+            break
+        if tag == DT_NEEDED:
+            return "dynamic"
+        if tag == DT_FLAGS_1:
+            pie = bool(value & DF_1_PIE)
+    return "static" if pie else "dynamic"
+
+
+def inspect_file(path: str | Path) -> dict[str, Any]:
+    is_elf = False
+    linking: str | None = None
+    try:
+        # Like `file -b`, report a symlink itself rather than its target.
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        pass
+    else:
+        try:
+            header = os.pread(fd, 64, 0)
+            is_elf = header[:4] == ELF_MAGIC
+            if is_elf:
+                linking = _elf_linking(fd, header)
+        except (OSError, OverflowError):
+            pass
+        finally:
+            os.close(fd)
     return {
         "path": str(path),
-        "description": desc,
         "is_elf": is_elf,
-        "is_static": is_static,
-        "is_dynamic": is_dynamic,
+        "is_static": linking == "static",
+        "is_dynamic": linking == "dynamic",
     }
 
 
+def _suffix(name: str) -> str:
+    # Path.suffix semantics: ".json" and "name." have no suffix.
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
+
+
+def _list_dir(path: str) -> tuple[list[os.DirEntry[str]], list[str]]:
+    """Split one directory into its non-directory entries and the subdirectories to enter.
+
+    Like os.walk(), symlinked directories are not entered and an unreadable
+    directory lists as empty.
+    """
+    files: list[os.DirEntry[str]] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        return [], []
+    return files, subdirs
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield the non-directory entries under ``root`` in os.walk() order."""
+    files, subdirs = _list_dir(root)
+    yield from files
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+def _scan_entries(entries: Iterable[os.DirEntry[str]], limit: int, prefix_len: int) -> list[str | None]:
+    """One slot per entry, up to ``limit``: its path if it is a candidate, else None."""
+    slots: list[str | None] = []
+    for entry in entries:
+        if len(slots) >= limit:
+            break
+        try:
+            # skip obvious text/config files quickly
+            if entry.is_file() and _suffix(entry.name) not in _SKIP_SUFFIXES:
+                slots.append(entry.path[prefix_len:])
+                continue
+        except Exception:
+            pass
+        slots.append(None)
+    return slots
+
+
+def _scan_subtree(subdir: str, limit: int, prefix_len: int) -> list[str | None]:
+    return _scan_entries(_iter_files(subdir), limit, prefix_len)
+
+
+def scan_tree(root: str, limit: int, prefix_len: int = 0, jobs: int = 1) -> list[str | None]:
+    """Slots for the first ``limit`` entries under ``root``, in os.walk() order.
+
+    With ``jobs > 1`` the top-level subdirectories are walked in a process
+    pool and concatenated in order. No single subtree can contribute more
+    than ``limit`` slots, so each worker stops there.
+    """
+    files, subdirs = _list_dir(root)
+    slots = _scan_entries(files, limit, prefix_len)
+    if jobs > 1 and len(subdirs) > 1 and len(slots) < limit:
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(subdirs)))
+        try:
+            for part in pool.map(_scan_subtree, subdirs, repeat(limit), repeat(prefix_len)):
+                slots.extend(part)
+                if len(slots) >= limit:
+                    break
+        finally:
+            pool.shutdown(cancel_futures=True)
+    else:
+        for subdir in subdirs:
+            if len(slots) >= limit:
+                break
+            slots.extend(_scan_subtree(subdir, limit - len(slots), prefix_len))
+    return slots[:limit]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Detect static ELF binaries under a path.")
     parser.add_argument("--root", type=Path, required=True, help="Root directory to scan")
@@ -41,36 +213,38 @@ def main() -> int:
         default=10000,
         help="Safety cap on scanned files (default: 10000)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for walking top-level subdirectories and classifying files "
+        "(default: CPU count; 1 = serial)",
+    )
     args = parser.parse_args()
 
     if not args.root.exists():
         raise SystemExit(f"root does not exist: {args.root}")
 
-    scanned = 0
-    findings: list[dict[str, Any]] = []
-    static_hits: list[dict[str, Any]] = []
+    root = os.fspath(args.root)
+    # Path(".") / name renders without a "./" prefix; keep reporting it that way.
+    prefix_len = len(os.curdir + os.sep) if root == os.curdir else 0
+    # The scanned count stops one past --max-files; only the entries within
+    # the cap are classified.
+    limit = max(args.max_files, 0) + 1
+    slots = scan_tree(root, limit, prefix_len, args.jobs)
+    scanned = len(slots)
+    candidates = [path for path in slots[: limit - 1] if path is not None]
 
-    for base, _, files in os.walk(args.root):
-        for filename in files:
-            path = Path(base) / filename
-            scanned += 1
-            if scanned > args.max_files:
-                break
-            try:
-                if not path.is_file():
-                    continue
-                # skip obvious text/config files quickly
-                if path.suffix in {".json", ".md", ".txt", ".toml", ".yaml", ".yml", ".sh", ".py", ".rs"}:
-                    continue
-                row = inspect_file(path)
-                if row["is_elf"]:
-                    findings.append(row)
-                    if row["is_static"]:
-                        static_hits.append(row)
-            except Exception:
-                continue
-        if scanned > args.max_files:
-            break
+    if args.jobs > 1 and len(candidates) > 1:
+        workers = min(args.jobs, len(candidates))
+        # Large chunks amortize the per-task IPC; map() keeps scan order.
+        chunksize = max(1, len(candidates) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(inspect_file, candidates, chunksize=chunksize))
+    else:
+        rows = [inspect_file(path) for path in candidates]
+    findings = [row for row in rows if row["is_elf"]]
+    static_hits = [row for row in findings if row["is_static"]]
 
     report = {
         "root": str(args.root),
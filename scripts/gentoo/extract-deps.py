@@ -49,6 +49,84 @@ def read_tier_map(path: Path) -> dict[str, str]:
     return tier_map
 
 
+# Focused package-to-package relations for better graph fidelity, as
+# (package, dependency, kind).
+_SPECIFIC_EDGES: tuple[tuple[str, str, str], ...] = (
+    ("net-misc/openssh", "dev-libs/openssl", "RDEPEND"),
+    ("net-misc/openssh", "app-crypt/mit-krb5", "RDEPEND"),
+    ("net-misc/curl", "dev-libs/openssl", "RDEPEND"),
+    ("net-misc/curl", "net-libs/gnutls", "RDEPEND"),
+    ("net-misc/curl", "dev-libs/libidn2", "RDEPEND"),
+    ("net-misc/curl", "net-libs/libpsl", "RDEPEND"),
+    ("net-misc/wget", "dev-libs/openssl", "RDEPEND"),
+    ("net-misc/wget", "net-libs/gnutls", "RDEPEND"),
+    ("net-misc/wget", "dev-libs/libidn2", "RDEPEND"),
+    ("mail-mta/postfix", "dev-libs/openssl", "RDEPEND"),
+    ("mail-mta/postfix", "app-crypt/mit-krb5", "RDEPEND"),
+    ("dev-db/postgresql", "dev-libs/openssl", "RDEPEND"),
+    ("dev-db/postgresql", "dev-libs/libxml2", "RDEPEND"),
+    ("dev-db/postgresql", "dev-libs/icu", "RDEPEND"),
+    ("dev-db/mariadb", "dev-libs/openssl", "RDEPEND"),
+    ("dev-db/mariadb", "dev-libs/libevent", "RDEPEND"),
+    ("dev-db/redis", "dev-libs/libevent", "RDEPEND"),
+    ("dev-db/redis", "dev-libs/openssl", "RDEPEND"),
+    ("dev-db/memcached", "dev-libs/libevent", "RDEPEND"),
+    ("www-servers/nginx", "dev-libs/openssl", "RDEPEND"),
+    ("www-servers/nginx", "dev-libs/libpcre2", "RDEPEND"),
+    ("www-servers/nginx", "dev-libs/libxml2", "RDEPEND"),
+    ("www-servers/apache", "dev-libs/openssl", "RDEPEND"),
+    ("www-servers/apache", "dev-libs/libpcre2", "RDEPEND"),
+    ("www-servers/lighttpd", "dev-libs/openssl", "RDEPEND"),
+    ("www-servers/lighttpd", "dev-libs/libpcre2", "RDEPEND"),
+    ("dev-util/git", "dev-libs/openssl", "RDEPEND"),
+    ("dev-util/git", "dev-libs/libpcre2", "RDEPEND"),
+    ("dev-util/git", "dev-libs/libcurl", "RDEPEND"),
+    ("dev-util/git", "dev-libs/libexpat", "RDEPEND"),
+    ("app-editors/neovim", "app-editors/vim", "RDEPEND"),
+    ("app-editors/neovim", "dev-libs/libuv", "RDEPEND"),
+    ("dev-libs/protobuf", "dev-cpp/abseil-cpp", "RDEPEND"),
+    ("dev-libs/protobuf", "dev-util/cmake", "BDEPEND"),
+    ("net-libs/grpc", "dev-libs/protobuf", "RDEPEND"),
+    ("net-libs/grpc", "dev-cpp/abseil-cpp", "RDEPEND"),
+    ("net-libs/grpc", "dev-libs/openssl", "RDEPEND"),
+    ("net-libs/grpc", "dev-util/cmake", "BDEPEND"),
+    ("app-containers/docker", "net-misc/curl", "RDEPEND"),
+    ("app-containers/docker", "dev-libs/protobuf", "RDEPEND"),
+    ("app-containers/docker", "dev-util/cmake", "BDEPEND"),
+    ("app-emulation/qemu", "dev-libs/glib", "RDEPEND"),
+    ("app-emulation/qemu", "dev-libs/libxml2", "RDEPEND"),
+    ("app-emulation/qemu", "dev-libs/openssl", "RDEPEND"),
+    ("app-emulation/wine", "dev-libs/libxml2", "RDEPEND"),
+    ("app-emulation/wine", "dev-libs/openssl", "RDEPEND"),
+    ("app-emulation/wine", "media-libs/libpng", "RDEPEND"),
+    ("app-emulation/wine", "media-libs/libjpeg-turbo", "RDEPEND"),
+    ("media-video/ffmpeg", "media-libs/libpng", "RDEPEND"),
+    ("media-video/ffmpeg", "media-libs/libjpeg-turbo", "RDEPEND"),
+    ("media-video/ffmpeg", "dev-libs/openssl", "RDEPEND"),
+    ("media-video/vlc", "media-video/ffmpeg", "RDEPEND"),
+    ("media-video/vlc", "dev-libs/openssl", "RDEPEND"),
+    ("media-video/vlc", "media-libs/libpng", "RDEPEND"),
+    ("net-misc/mosquitto", "dev-libs/openssl", "RDEPEND"),
+    ("net-misc/mosquitto", "net-libs/libevent", "RDEPEND"),
+    ("net-p2p/transmission", "net-misc/curl", "RDEPEND"),
+    ("net-p2p/transmission", "dev-libs/libevent", "RDEPEND"),
+    ("sys-apps/systemd", "dev-libs/libpcre2", "RDEPEND"),
+    ("sys-apps/systemd", "dev-libs/openssl", "RDEPEND"),
+    ("app-text/xmlto", "dev-libs/libxml2", "RDEPEND"),
+    ("app-text/xmlto", "dev-libs/libxslt", "RDEPEND"),
+    ("app-text/poppler", "dev-libs/libxml2", "RDEPEND"),
+    ("app-text/poppler", "dev-libs/icu", "RDEPEND"),
+    ("app-text/ghostscript-gpl", "dev-libs/libidn2", "RDEPEND"),
+    ("app-text/ghostscript-gpl", "dev-libs/icu", "RDEPEND"),
+)
+
+# Normalize legacy aliases inside the curated top100 set.
+_DEP_ALIASES = {
+    "dev-libs/libcurl": "net-misc/curl",
+    "dev-libs/libexpat": "dev-libs/expat",
+}
+
+
 def build_edges(packages: list[str]) -> set[Edge]:
     pkg_set = set(packages)
     edges: set[Edge] = set()
@@ -83,135 +161,150 @@ def build_edges(packages: list[str]) -> set[Edge]:
             if dep in pkg_set:
                 edges.add(Edge(dep, pkg, "BDEPEND"))
 
-    # Focused package-to-package relations for better graph fidelity.
-    specific: dict[str, list[tuple[str, str]]] = {
-        "net-misc/openssh": [("dev-libs/openssl", "RDEPEND"), ("app-crypt/mit-krb5", "RDEPEND")],
-        "net-misc/curl": [("dev-libs/openssl", "RDEPEND"), ("net-libs/gnutls", "RDEPEND"), ("dev-libs/libidn2", "RDEPEND"), ("net-libs/libpsl", "RDEPEND")],
-        "net-misc/wget": [("dev-libs/openssl", "RDEPEND"), ("net-libs/gnutls", "RDEPEND"), ("dev-libs/libidn2", "RDEPEND")],
-        "mail-mta/postfix": [("dev-libs/openssl", "RDEPEND"), ("app-crypt/mit-krb5", "RDEPEND")],
-        "dev-db/postgresql": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libxml2", "RDEPEND"), ("dev-libs/icu", "RDEPEND")],
-        "dev-db/mariadb": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libevent", "RDEPEND")],
-        "dev-db/redis": [("dev-libs/libevent", "RDEPEND"), ("dev-libs/openssl", "RDEPEND")],
-        "dev-db/memcached": [("dev-libs/libevent", "RDEPEND")],
-        "www-servers/nginx": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libpcre2", "RDEPEND"), ("dev-libs/libxml2", "RDEPEND")],
-        "www-servers/apache": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libpcre2", "RDEPEND")],
-        "www-servers/lighttpd": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libpcre2", "RDEPEND")],
-        "dev-util/git": [("dev-libs/openssl", "RDEPEND"), ("dev-libs/libpcre2", "RDEPEND"), ("dev-libs/libcurl", "RDEPEND"), ("dev-libs/libexpat", "RDEPEND")],
-        "app-editors/neovim": [("app-editors/vim", "RDEPEND"), ("dev-libs/libuv", "RDEPEND")],
-        "dev-libs/protobuf": [("dev-cpp/abseil-cpp", "RDEPEND"), ("dev-util/cmake", "BDEPEND")],
-        "net-libs/grpc": [("dev-libs/protobuf", "RDEPEND"), ("dev-cpp/abseil-cpp", "RDEPEND"), ("dev-libs/openssl", "RDEPEND"), ("dev-util/cmake", "BDEPEND")],
-        "app-containers/docker": [("net-misc/curl", "RDEPEND"), ("dev-libs/protobuf", "RDEPEND"), ("dev-util/cmake", "BDEPEND")],
-        "app-emulation/qemu": [("dev-libs/glib", "RDEPEND"), ("dev-libs/libxml2", "RDEPEND"), ("dev-libs/openssl", "RDEPEND")],
-        "app-emulation/wine": [("dev-libs/libxml2", "RDEPEND"), ("dev-libs/openssl", "RDEPEND"), ("media-libs/libpng", "RDEPEND"), ("media-libs/libjpeg-turbo", "RDEPEND")],
-        "media-video/ffmpeg": [("media-libs/libpng", "RDEPEND"), ("media-libs/libjpeg-turbo", "RDEPEND"), ("dev-libs/openssl", "RDEPEND")],
-        "media-video/vlc": [("media-video/ffmpeg", "RDEPEND"), ("dev-libs/openssl", "RDEPEND"), ("media-libs/libpng", "RDEPEND")],
-        "net-misc/mosquitto": [("dev-libs/openssl", "RDEPEND"), ("net-libs/libevent", "RDEPEND")],
-        "net-p2p/transmission": [("net-misc/curl", "RDEPEND"), ("dev-libs/libevent", "RDEPEND")],
-        "sys-apps/systemd": [("dev-libs/libpcre2", "RDEPEND"), ("dev-libs/openssl", "RDEPEND")],
-        "app-text/xmlto": [("dev-libs/libxml2", "RDEPEND"), ("dev-libs/libxslt", "RDEPEND")],
-        "app-text/poppler": [("dev-libs/libxml2", "RDEPEND"), ("dev-libs/icu", "RDEPEND")],
-        "app-text/ghostscript-gpl": [("dev-libs/libidn2", "RDEPEND"), ("dev-libs/icu", "RDEPEND")],
-    }
-    for pkg, deps in specific.items():
-        if pkg not in pkg_set:
-            continue
-        for dep, kind in deps:
-            # normalize legacy aliases inside this curated top100 set
-            alias_map = {
-                "dev-libs/libcurl": "net-misc/curl",
-                "dev-libs/libexpat": "dev-libs/expat",
-            }
-            dep = alias_map.get(dep, dep)
-            if dep in pkg_set and dep != pkg:
-                edges.add(Edge(dep, pkg, kind))
+    for pkg, dep, kind in _SPECIFIC_EDGES:
+        dep = _DEP_ALIASES.get(dep, dep)
+        if pkg in pkg_set and dep in pkg_set and dep != pkg:
+            edges.add(Edge(dep, pkg, kind))
 
     return edges
 
 
-def compute_reachability_count(nodes: list[str], adjacency: dict[str, set[str]]) -> dict[str, int]:
+def compute_reachability_count(components: Iterable[list[str]], adjacency: dict[str, set[str]]) -> dict[str, int]:
+    """Count the nodes reachable from each node through ``adjacency``, excluding itself.
+
+    ``components`` are the graph's SCCs ordered so that every edge leads to the
+    same or an earlier component. Reachable sets are int bitmasks folded in that
+    order; all members of one component share a mask.
+    """
+    bit: dict[str, int] = {}
+    reach: dict[str, int] = {}
     counts: dict[str, int] = {}
-    for node in nodes:
-        seen: set[str] = set()
-        stack = list(adjacency[node])
-        while stack:
-            nxt = stack.pop()
-            if nxt == node or nxt in seen:
-                continue
-            seen.add(nxt)
-            stack.extend(adjacency[nxt])
-        counts[node] = len(seen)
+    for comp in components:
+        for node in comp:
+            bit[node] = 1 << len(bit)
+        mask = 0
+        for node in comp:
+            for nxt in adjacency[node]:
+                mask |= bit[nxt] | reach.get(nxt, 0)
+        for node in comp:
+            reach[node] = mask
+            counts[node] = (mask & ~bit[node]).bit_count()
     return counts
 
 
-def compute_scc(nodes: list[str], outgoing: dict[str, set[str]], incoming: dict[str, set[str]]) -> list[list[str]]:
-    visited: set[str] = set()
-    post_order: list[str] = []
-
-    def dfs1(node: str) -> None:
-        stack = [node]
-        local_seen: set[str] = set()
-        while stack:
-            cur = stack[-1]
-            if cur not in visited:
-                visited.add(cur)
-            pushed = False
-            for nxt in sorted(outgoing[cur]):
-                if nxt not in visited:
-                    stack.append(nxt)
-                    pushed = True
-                    break
-            if pushed:
-                continue
-            if cur not in local_seen:
-                local_seen.add(cur)
-                post_order.append(cur)
-            stack.pop()
-
-    for n in nodes:
-        if n not in visited:
-            dfs1(n)
-
-    assigned: set[str] = set()
+def compute_scc(nodes: list[str], outgoing: dict[str, set[str]]) -> list[list[str]]:
+    """Strongly connected components (iterative Tarjan), each sorted.
+
+    Components are listed sources-first: the reverse of Tarjan's emission
+    order, which is the order a Kosaraju pass over ``nodes`` yields.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    scc_stack: list[str] = []
     components: list[list[str]] = []
-    for node in reversed(post_order):
-        if node in assigned:
+
+    for root in nodes:
+        if root in index:
             continue
-        comp: list[str] = []
-        stack = [node]
-        assigned.add(node)
-        while stack:
-            cur = stack.pop()
-            comp.append(cur)
-            for prev in sorted(incoming[cur]):
-                if prev not in assigned:
-                    assigned.add(prev)
-                    stack.append(prev)
-        components.append(sorted(comp))
+        index[root] = lowlink[root] = len(index)
+        scc_stack.append(root)
+        on_stack.add(root)
+        # Each node's successors are sorted once, when it is first visited.
+        work = [(root, iter(sorted(outgoing[root])))]
+        while work:
+            node, successors = work[-1]
+            for nxt in successors:
+                if nxt not in index:
+                    index[nxt] = lowlink[nxt] = len(index)
+                    scc_stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(sorted(outgoing[nxt]))))
+                    break
+                if nxt in on_stack and index[nxt] < lowlink[node]:
+                    lowlink[node] = index[nxt]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    comp: list[str] = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        comp.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(comp))
+
+    components.reverse()
     return components
 
 
+def compute_waves(nodes: list[str], outgoing: dict[str, set[str]]) -> list[list[str]]:
+    """Build waves by Kahn's algorithm, each wave sorted.
+
+    Nodes still blocked by a cycle are appended, sorted, as one final wave.
+    The pass runs over int indices assigned in sorted atom order, so sorting a
+    wave's indices also sorts its atoms.
+    """
+    atoms = sorted(nodes)
+    idx = {atom: i for i, atom in enumerate(atoms)}
+    children = [[idx[child] for child in outgoing[atom]] for atom in atoms]
+    indeg = [0] * len(atoms)
+    for succ in children:
+        for child in succ:
+            indeg[child] += 1
+
+    waves: list[list[int]] = []
+    placed = 0
+    current = [i for i, n in enumerate(indeg) if n == 0]
+    while current:
+        waves.append(current)
+        placed += len(current)
+        # Each node becomes ready exactly once, so a wave is a plain list
+        # sorted once when it closes.
+        ready: list[int] = []
+        for node in current:
+            for child in children[node]:
+                indeg[child] -= 1
+                if indeg[child] == 0:
+                    ready.append(child)
+        ready.sort()
+        current = ready
+
+    if placed < len(atoms):
+        waves.append([i for i, n in enumerate(indeg) if n > 0])
+    return [[atoms[i] for i in wave] for wave in waves]
+
+
+_TIER_BUILD_MINUTES: dict[str, int] = {
+    "tier1-core-infrastructure": 4,
+    "tier2-security-critical": 6,
+    "tier3-allocation-heavy": 8,
+    "tier4-string-heavy": 5,
+    "tier5-threading-heavy": 7,
+}
+
+_HEAVY_BUILD_MINUTES: dict[str, int] = {
+    "sys-devel/gcc": 18,
+    "sys-libs/glibc": 12,
+    "app-emulation/qemu": 14,
+    "app-emulation/wine": 16,
+    "app-containers/docker": 10,
+    "dev-db/postgresql": 11,
+    "dev-db/mariadb": 12,
+    "media-video/ffmpeg": 10,
+    "media-video/vlc": 9,
+}
+
+
 def estimate_build_minutes(atom: str, tier_id: str) -> int:
-    tier_defaults = {
-        "tier1-core-infrastructure": 4,
-        "tier2-security-critical": 6,
-        "tier3-allocation-heavy": 8,
-        "tier4-string-heavy": 5,
-        "tier5-threading-heavy": 7,
-    }
-    heavy_overrides = {
-        "sys-devel/gcc": 18,
-        "sys-libs/glibc": 12,
-        "app-emulation/qemu": 14,
-        "app-emulation/wine": 16,
-        "app-containers/docker": 10,
-        "dev-db/postgresql": 11,
-        "dev-db/mariadb": 12,
-        "media-video/ffmpeg": 10,
-        "media-video/vlc": 9,
-    }
-    if atom in heavy_overrides:
-        return heavy_overrides[atom]
-    return tier_defaults.get(tier_id, 6)
+    if atom in _HEAVY_BUILD_MINUTES:
+        return _HEAVY_BUILD_MINUTES[atom]
+    return _TIER_BUILD_MINUTES.get(tier_id, 6)
 
 
 def main() -> int:
@@ -249,42 +342,15 @@ def main() -> int:
         incoming[e.pkg].add(e.dep)
         kind_by_edge[(e.dep, e.pkg)] = e.kind
 
-    # Build waves + topological order (Kahn).
-    indeg = {p: len(incoming[p]) for p in packages}
-    wave_index: dict[str, int] = {}
-    build_order: list[str] = []
-    waves: list[list[str]] = []
-    remaining = set(packages)
-
-    current_wave = sorted([p for p in packages if indeg[p] == 0])
-    wave_no = 0
-    while current_wave:
-        waves.append(current_wave)
-        next_wave_candidates: set[str] = set()
-        for node in current_wave:
-            if node not in remaining:
-                continue
-            remaining.remove(node)
-            build_order.append(node)
-            wave_index[node] = wave_no
-            for child in sorted(outgoing[node]):
-                indeg[child] -= 1
-                if indeg[child] == 0:
-                    next_wave_candidates.add(child)
-        wave_no += 1
-        current_wave = sorted(next_wave_candidates)
-
-    # If any nodes remain due cycle, append deterministically as final wave.
-    if remaining:
-        cycle_wave = sorted(remaining)
-        waves.append(cycle_wave)
-        for node in cycle_wave:
-            build_order.append(node)
-            wave_index[node] = wave_no
-
-    descendants_count = compute_reachability_count(build_order, outgoing)
-    ancestors_count = compute_reachability_count(build_order, incoming)
-    scc = compute_scc(packages, outgoing, incoming)
+    waves = compute_waves(packages, outgoing)
+    wave_index = {node: wave_no for wave_no, wave in enumerate(waves) for node in wave}
+    build_order = [node for wave in waves for node in wave]
+
+    # scc lists components sources-first: descendants fold sinks-first,
+    # ancestors fold in the listed order.
+    scc = compute_scc(packages, outgoing)
+    descendants_count = compute_reachability_count(reversed(scc), outgoing)
+    ancestors_count = compute_reachability_count(scc, incoming)
 
     max_in = max((len(incoming[p]) for p in packages), default=1)
     n_minus_1 = max(len(packages) - 1, 1)
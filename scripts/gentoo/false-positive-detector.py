@@ -8,6 +8,27 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+_NUMBER = (int, float)
+
+
+def load_summary(path: Path) -> Dict[str, Any]:
+    """Parse a healing summary with the stdlib.
+
+    orjson would turn integers wider than 64 bits anywhere in the nested
+    rates and size averages into floats; a summary is one small file, so
+    exactness wins over parse speed here.
+    """
+    return json.loads(path.read_bytes())
+
+
+def render_json(payload: Dict[str, Any]) -> str:
+    """Key-sorted, 2-space indented JSON.
+
+    Rendered by the stdlib so non-finite rates stay ``Infinity``/``NaN`` and
+    floats keep Python's repr; orjson would write them as ``null``.
+    """
+    return json.dumps(payload, indent=2, sort_keys=True)
+
 
 def detect_false_positives(
     summary: Dict[str, Any],
@@ -19,7 +40,7 @@ def detect_false_positives(
     by_package = summary.get("by_package", {})
     for package, pkg in by_package.items():
         rate = pkg.get("actions_per_1000_calls")
-        if isinstance(rate, (int, float)) and rate > max_action_rate_per_1000:
+        if isinstance(rate, _NUMBER) and rate > max_action_rate_per_1000:
             candidates.append(
                 {
                     "kind": "high_action_rate",
@@ -29,14 +50,14 @@ def detect_false_positives(
                 }
             )
 
-    for row in summary.get("top_call_sites", []):
-        if row.get("healing_action") != "ClampSize":
-            continue
+    clamp_rows = [row for row in summary.get("top_call_sites", ()) if row.get("healing_action") == "ClampSize"]
+    clamp_factor = 1.0 + clamp_margin
+    for row in clamp_rows:
         orig = row.get("original_size_avg")
         clamped = row.get("clamped_size_avg")
-        if not isinstance(orig, (int, float)) or not isinstance(clamped, (int, float)):
+        if not isinstance(orig, _NUMBER) or not isinstance(clamped, _NUMBER):
             continue
-        if orig <= clamped * (1.0 + clamp_margin):
+        if orig <= clamped * clamp_factor:
             candidates.append(
                 {
                     "kind": "possible_unnecessary_clamp",
@@ -77,7 +98,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    summary = json.loads(Path(args.summary_json).read_text(encoding="utf-8"))
+    summary = load_summary(Path(args.summary_json))
     candidates = detect_false_positives(
         summary=summary,
         max_action_rate_per_1000=args.max_action_rate_per_1000,
@@ -88,7 +109,7 @@ def main() -> int:
         "candidate_count": len(candidates),
         "candidates": candidates,
     }
-    rendered = json.dumps(payload, indent=2, sort_keys=True)
+    rendered = render_json(payload)
     if args.output:
         out = Path(args.output)
         out.parent.mkdir(parents=True, exist_ok=True)
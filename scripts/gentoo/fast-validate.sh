@@ -24,7 +24,8 @@ EXCLUSIONS_FILE="${ROOT}/configs/gentoo/exclusions.json"
 BUILD_CONFIG="${ROOT}/configs/gentoo/build-config.toml"
 
 TIMESTAMP="$(date -u +%Y%m%dT%H%M%SZ)"
-RESULTS_DIR="${ROOT}/artifacts/gentoo-builds/fast-validate/${TIMESTAMP}"
+RESULTS_ROOT="${FAST_VALIDATE_RESULTS_ROOT:-${ROOT}/artifacts/gentoo-builds/fast-validate}"
+RESULTS_DIR="${RESULTS_ROOT}/${TIMESTAMP}"
 SUMMARY_FILE="${RESULTS_DIR}/summary.json"
 LOG_FILE="${RESULTS_DIR}/fast-validate.log"
 
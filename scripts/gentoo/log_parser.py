@@ -6,7 +6,36 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _inexact(payload: Any) -> bool:
+    # orjson decodes integers wider than 64 bits as floats; records with a
+    # top-level float are re-parsed by the stdlib so such values stay exact.
+    return isinstance(payload, dict) and float in map(type, payload.values())
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        try:
+            payload = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # NaN and lone surrogates are still accepted by the stdlib parser,
+            # which also supplies the error message otherwise.
+            pass
+        else:
+            if not _inexact(payload):
+                return payload
+    return json.loads(text)
+
+# Shared, read-only LogEntry.raw for parsers that do not keep payloads.
+_NO_RAW: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass
@@ -19,7 +48,7 @@ class ParseError(Exception):
         return f"line {self.line_num}: {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     timestamp: str
     pid: int
@@ -32,30 +61,50 @@ class LogEntry:
     action_details: Optional[Dict[str, Any]] = None
     stack_hash: Optional[str] = None
     source_line: int = 0
-    raw: Dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=dict)
 
 
 class LogParser:
-    def __init__(self, strict: bool = True) -> None:
+    def __init__(self, strict: bool = True, keep_raw: bool = False) -> None:
         self.strict = strict
+        # The full decoded record stays reachable from every entry only on
+        # request; otherwise it is dropped once its fields are extracted.
+        self.keep_raw = keep_raw
         self.errors: List[ParseError] = []
 
     def parse_file(self, path: Path) -> Iterator[LogEntry]:
-        with path.open("r", encoding="utf-8", errors="replace") as fh:
+        with path.open("rb", buffering=1 << 20) as fh:
             for line_num, line in enumerate(fh, 1):
-                entry = self.parse_line(line, line_num)
+                entry = self._parse_raw_line(line, line_num)
                 if entry is not None:
                     yield entry
 
+    def _parse_raw_line(self, line: bytes, line_num: int) -> Optional[LogEntry]:
+        # Well-formed records go straight from bytes through orjson (which
+        # skips the surrounding whitespace itself); anything else, including
+        # records _inexact() flags, takes the text path with its
+        # replace-decoding and strip().
+        if orjson is not None:
+            try:
+                payload = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                if not _inexact(payload):
+                    return self._parse_payload(payload, line_num)
+        return self.parse_line(line.decode("utf-8", errors="replace"), line_num)
+
     def parse_line(self, line: str, line_num: int = 1) -> Optional[LogEntry]:
         stripped = line.strip()
         if not stripped:
             return None
         try:
-            payload = json.loads(stripped)
+            payload = _loads(stripped)
         except json.JSONDecodeError as exc:
             return self._handle_error(ParseError(line_num, f"invalid JSON: {exc}", stripped))
+        return self._parse_payload(payload, line_num)
 
+    def _parse_payload(self, payload: Dict[str, Any], line_num: int) -> Optional[LogEntry]:
         try:
             entry = self._normalize(payload, line_num)
         except ParseError as exc:
@@ -63,12 +112,16 @@ class LogParser:
         return entry
 
     def _normalize(self, payload: Dict[str, Any], line_num: int) -> LogEntry:
-        timestamp = payload.get("ts") or payload.get("timestamp")
-        pid = payload.get("pid")
-        call = payload.get("call")
-        latency_ns = payload.get("latency_ns")
-
-        if call is None and payload.get("event") is not None:
+        # Each field is read once; the key literals are already interned
+        # constants, so module-level aliases would only add global lookups.
+        get = payload.get
+        timestamp = get("ts") or get("timestamp")
+        pid = get("pid")
+        call = get("call")
+        latency_ns = get("latency_ns")
+        event = get("event")
+
+        if call is None and event is not None:
             call = "__hook_event__"
         if latency_ns is None:
             latency_ns = 0
@@ -85,17 +138,19 @@ class LogParser:
         if missing:
             raise ParseError(line_num, f"missing required field(s): {', '.join(missing)}", json.dumps(payload))
 
-        action = payload.get("action")
-        if action is None and payload.get("event") in {"enable", "disable", "skip"}:
-            action = f"hook_{payload['event']}"
+        action = get("action")
+        if action is None and event in {"enable", "disable", "skip"}:
+            action = f"hook_{event}"
 
-        args = payload.get("args") if isinstance(payload.get("args"), dict) else {}
-        result = payload.get("result") if isinstance(payload.get("result"), dict) else None
-        action_details = payload.get("action_details") if isinstance(payload.get("action_details"), dict) else None
+        args = get("args")
+        result = get("result")
+        action_details = get("action_details")
+        tid = get("tid")
+        stack_hash = get("stack_hash")
 
         try:
             pid_int = int(pid)
-            tid_int = int(payload["tid"]) if payload.get("tid") is not None else None
+            tid_int = int(tid) if tid is not None else None
             latency_int = int(latency_ns)
         except Exception as exc:  # noqa: BLE001
             raise ParseError(line_num, f"type conversion error: {exc}", json.dumps(payload)) from exc
@@ -106,13 +161,13 @@ class LogParser:
             call=str(call),
             latency_ns=latency_int,
             tid=tid_int,
-            args=args,
-            result=result,
+            args=args if isinstance(args, dict) else {},
+            result=result if isinstance(result, dict) else None,
             action=str(action) if action is not None else None,
-            action_details=action_details,
-            stack_hash=str(payload.get("stack_hash")) if payload.get("stack_hash") is not None else None,
+            action_details=action_details if isinstance(action_details, dict) else None,
+            stack_hash=str(stack_hash) if stack_hash is not None else None,
             source_line=line_num,
-            raw=payload,
+            raw=payload if self.keep_raw else _NO_RAW,
         )
 
     def _handle_error(self, error: ParseError) -> Optional[LogEntry]:
@@ -6,6 +6,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional
 
 try:
@@ -53,20 +54,19 @@ class LogValidator:
     def validate_entry(self, entry: LogEntry) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
-        if entry.latency_ns < 0 or entry.latency_ns > self.max_latency_ns:
-            issues.append(
-                ValidationIssue("error", f"latency out of bounds: {entry.latency_ns}", entry.source_line, entry.call)
-            )
-        elif entry.latency_ns > self.high_latency_ns:
-            issues.append(
-                ValidationIssue("warning", f"high latency detected: {entry.latency_ns}", entry.source_line, entry.call)
-            )
+        latency = entry.latency_ns
+        if latency < 0 or latency > self.max_latency_ns:
+            issues.append(ValidationIssue("error", f"latency out of bounds: {latency}", entry.source_line, entry.call))
+        elif latency > self.high_latency_ns:
+            issues.append(ValidationIssue("warning", f"high latency detected: {latency}", entry.source_line, entry.call))
 
-        if entry.action and entry.action not in self.known_actions:
-            issues.append(ValidationIssue("warning", f"unknown action: {entry.action}", entry.source_line, entry.call))
+        action = entry.action
+        if action and action not in self.known_actions:
+            issues.append(ValidationIssue("warning", f"unknown action: {action}", entry.source_line, entry.call))
 
-        if entry.result and isinstance(entry.result, dict):
-            ptr = entry.result.get("ptr")
+        result = entry.result
+        if result and isinstance(result, dict):
+            ptr = result.get("ptr")
             if isinstance(ptr, str) and ptr and not POINTER_RE.match(ptr):
                 issues.append(ValidationIssue("error", f"invalid pointer format: {ptr}", entry.source_line, entry.call))
 
@@ -74,28 +74,36 @@ class LogValidator:
         if ts is None:
             issues.append(ValidationIssue("error", f"invalid timestamp: {entry.timestamp}", entry.source_line, entry.call))
         else:
-            prev = self._last_ts_by_pid.get(entry.pid)
+            pid = entry.pid
+            last_ts_by_pid = self._last_ts_by_pid
+            prev = last_ts_by_pid.get(pid)
             if prev and ts < prev:
                 issues.append(
                     ValidationIssue(
                         "warning",
-                        f"non-monotonic timestamp for pid {entry.pid}: {entry.timestamp}",
+                        f"non-monotonic timestamp for pid {pid}: {entry.timestamp}",
                         entry.source_line,
                         entry.call,
                     )
                 )
-            self._last_ts_by_pid[entry.pid] = ts
+            last_ts_by_pid[pid] = ts
 
         return issues
 
     def validate(self, entries: Iterable[LogEntry]) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
+        validate_entry = self.validate_entry
         for entry in entries:
-            issues.extend(self.validate_entry(entry))
+            found = validate_entry(entry)
+            if found:
+                issues.extend(found)
         return issues
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _parse_timestamp(value: str) -> Optional[datetime]:
+        # Consecutive entries usually repeat a timestamp, so recent parses are
+        # memoized; datetimes are immutable and safe to share.
         try:
             if value.endswith("Z"):
                 value = value[:-1] + "+00:00"
@@ -15,6 +15,7 @@ import argparse
 import hashlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -30,13 +31,21 @@ def utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+# Read size for hashing evidence artifacts on Pythons without hashlib.file_digest.
+HASH_CHUNK_BYTES = 256 * 1024
+
+
 def file_sha256(path: Path) -> Optional[str]:
-    """Compute SHA-256 hash of a file."""
+    """Compute SHA-256 hash of a file, streaming it rather than loading it whole."""
     if not path.exists():
         return None
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 
 def parse_source_ref(ref: str) -> Optional[Tuple[str, int]]:
@@ -184,12 +193,30 @@ class BinderValidationReport:
         return "\n".join(lines)
 
 
+def source_line_count(path: Path, cache: Dict[Path, Optional[int]]) -> Optional[int]:
+    """Line count of a source_ref target, or None if it does not exist.
+
+    ``cache`` is shared across obligations, so a file anchored by many refs
+    is read once.
+    """
+    if path in cache:
+        return cache[path]
+    count: Optional[int] = None
+    if path.exists():
+        count = len(path.read_text(encoding="utf-8", errors="replace").splitlines())
+    cache[path] = count
+    return count
+
+
 def validate_obligation(
     obligation: Dict[str, Any],
     repo_root: Path,
     check_hashes: bool = True,
+    line_counts: Optional[Dict[Path, Optional[int]]] = None,
 ) -> ObligationStatus:
     """Validate a single proof obligation."""
+    if line_counts is None:
+        line_counts = {}
     oid = obligation.get("id", "unknown")
     status = ObligationStatus(
         obligation_id=oid,
@@ -268,8 +295,8 @@ def validate_obligation(
             continue
 
         rel_path, line_number = parsed
-        full_path = repo_root / rel_path
-        if not full_path.exists():
+        line_count = source_line_count(repo_root / rel_path, line_counts)
+        if line_count is None:
             status.source_refs_invalid += 1
             status.valid = False
             status.source_ref_results[source_ref] = "missing_file"
@@ -281,7 +308,6 @@ def validate_obligation(
             ))
             continue
 
-        line_count = len(full_path.read_text(encoding="utf-8", errors="replace").splitlines())
         if line_number > line_count:
             status.source_refs_invalid += 1
             status.valid = False
@@ -305,8 +331,15 @@ def validate_binder(
     repo_root: Path,
     dry_run: bool = False,
     check_hashes: bool = True,
+    jobs: Optional[int] = None,
 ) -> BinderValidationReport:
-    """Validate the complete proof obligations binder."""
+    """Validate the complete proof obligations binder.
+
+    Obligations are checked on a pool of ``jobs`` threads (the executor's
+    default when None, serially when ``jobs <= 1``); their checks are mostly
+    file stats, reads and hashing, which release the GIL. Report order
+    follows the binder.
+    """
     report = BinderValidationReport(timestamp=utc_now(), dry_run=dry_run)
 
     if not binder_path.exists():
@@ -322,12 +355,15 @@ def validate_binder(
 
     obligations = data.get("obligations", [])
 
-    # Check for duplicate IDs
+    # Check for duplicate IDs; the remaining obligations are validated below
+    # and slotted back into binder order.
+    slots: List[Optional[ObligationStatus]] = []
+    pending: List[Tuple[int, Dict[str, Any]]] = []
     seen_ids: Set[str] = set()
     for ob in obligations:
         oid = ob.get("id", "")
         if oid in seen_ids:
-            report.obligations.append(ObligationStatus(
+            slots.append(ObligationStatus(
                 obligation_id=oid,
                 statement=ob.get("statement", ""),
                 category=ob.get("category", "unknown"),
@@ -340,10 +376,24 @@ def validate_binder(
             ))
             continue
         seen_ids.add(oid)
+        pending.append((len(slots), ob))
+        slots.append(None)
+
+    line_counts: Dict[Path, Optional[int]] = {}
+
+    def check(ob: Dict[str, Any]) -> ObligationStatus:
+        return validate_obligation(ob, repo_root, check_hashes=check_hashes, line_counts=line_counts)
 
-        status = validate_obligation(ob, repo_root, check_hashes=check_hashes)
-        report.obligations.append(status)
+    pending_obs = [ob for _, ob in pending]
+    if (jobs is not None and jobs <= 1) or len(pending_obs) <= 1:
+        statuses = list(map(check, pending_obs))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            statuses = list(pool.map(check, pending_obs))
+    for (slot, _), status in zip(pending, statuses):
+        slots[slot] = status
 
+    report.obligations = [status for status in slots if status is not None]
     report.compute_status()
     return report
 
@@ -357,12 +407,15 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--no-hashes", action="store_true",
                         help="Skip SHA-256 hash computation")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Threads used to validate obligations (default: executor default; 1 = serial)")
     args = parser.parse_args(argv)
 
     report = validate_binder(
         args.binder, REPO_ROOT,
         dry_run=args.dry_run,
         check_hashes=not args.no_hashes,
+        jobs=args.jobs,
     )
 
     if args.format == "terminal":
@@ -87,6 +87,22 @@ def parse_test_log(log_path: Path, exit_code: int, duration_seconds: float) -> M
     )
 
 
+def count_healing_actions(franken_log: Path) -> Dict[str, int]:
+    """Tally healing actions in a FrankenLibC JSONL log, one line at a time."""
+    actions: Dict[str, int] = {}
+    with franken_log.open(encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            action = json.loads(line).get("action")
+            if not action:
+                continue
+            key = str(action)
+            actions[key] = actions.get(key, 0) + 1
+    return actions
+
+
 def run_mode(
     image: str,
     package: str,
@@ -150,17 +166,7 @@ def run_mode(
         parsed.healing_breakdown = {}
         if franken_log.exists():
             try:
-                actions: Dict[str, int] = {}
-                for line in franken_log.read_text(encoding="utf-8", errors="replace").splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    payload = json.loads(line)
-                    action = payload.get("action")
-                    if not action:
-                        continue
-                    key = str(action)
-                    actions[key] = actions.get(key, 0) + 1
+                actions = count_healing_actions(franken_log)
                 parsed.healing_breakdown = actions
                 parsed.healing_actions = sum(actions.values())
             except Exception:
@@ -112,6 +112,28 @@ class BuildRunnerTests(unittest.TestCase):
         self.assertEqual(results["sys-devel/binutils"].attempts, 2)
         self.assertEqual(results["sys-devel/gcc"].result, "success")
 
+    def test_state_file_flushed_after_debounced_saves(self) -> None:
+        # gcc completes well inside the save interval after binutils, so only
+        # the flush on the stop-on-failure exit path persists it.
+        runner = self.module.BuildRunner(self.config)
+
+        with patch.object(
+            runner,
+            "_run_package_once",
+            side_effect=[
+                self._result("sys-devel/binutils", "success", 1),
+                self._result("sys-devel/gcc", "failed", 1),
+            ],
+        ):
+            self.config.max_retries = 0
+            self.config.stop_on_failure = True
+            with self.assertRaises(RuntimeError):
+                runner.run()
+
+        state = json.loads(self.config.state_file.read_text(encoding="utf-8"))
+        self.assertEqual(state["results"]["sys-devel/binutils"]["result"], "success")
+        self.assertEqual(state["results"]["sys-devel/gcc"]["result"], "failed")
+
     def test_resume_skips_existing_results(self) -> None:
         state_payload = {
             "updated_at": "2026-02-13T00:00:00Z",
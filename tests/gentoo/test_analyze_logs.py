@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[attr-defined]
+    return module
+
+
+class AnalyzeLogsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repo = Path(__file__).resolve().parents[2]
+        cls.mod = load_module("analyze_logs", repo / "scripts/gentoo/analyze-logs.py")
+
+    def test_big_integer_latency_stays_exact(self) -> None:
+        big = 2**64 + 1
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.jsonl").write_text(
+                f'{{"call": "malloc", "latency_ns": {big}}}\n'
+                '{"call": "free", "latency_ns": 2.5}\n'
+                '{"call": "free", "latency_ns": 7}\n',
+                encoding="utf-8",
+            )
+            summary = self.mod.analyze(root, 5)
+        self.assertEqual(summary["latency_ns"]["count"], 2)
+        self.assertEqual(summary["latency_ns"]["max"], big)
+        self.assertEqual(summary["latency_ns"]["min"], 7)
+        self.assertIn(str(big).encode(), self.mod.render_json(summary))
+
+    def test_big_integer_in_any_field_stays_exact(self) -> None:
+        big = 2**64 + 1
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.jsonl").write_text(
+                f'{{"call": {big}, "atom": {big}, "latency_ns": 3}}\n',
+                encoding="utf-8",
+            )
+            summary = self.mod.analyze(root, 5)
+        self.assertEqual(summary["top_calls"], [(str(big), 1)])
+        self.assertEqual(summary["top_atoms"], [(str(big), 1)])
+
+    def write_log(self, root: Path, name: str) -> Path:
+        path = root / name
+        path.write_bytes(
+            b'{"event": "call", "call": "malloc", "latency_ns": 120, "atom": "dev-db/redis"}\n'
+            b'{"event": "call", "call": "free", "latency_ns": 7}\r\n'
+            b"\n"
+            b"{bad json\n"
+            b"2026-01-01T00:00:00Z atom=sys-apps/sed phase=compile msg=ok\r\n"
+            b'{"event": "heal", "action": "ClampSize", "latency_ns": 4000}'
+        )
+        return path
+
+    def test_split_log_file_spans_are_line_aligned(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.write_log(Path(tmp), "a.jsonl")
+            data = path.read_bytes()
+            for chunk_bytes in (1, 5, 17, len(data) - 1, len(data)):
+                spans = self.mod._split_log_file(str(path), len(data), chunk_bytes)
+                with self.subTest(chunk_bytes=chunk_bytes):
+                    self.assertEqual(spans[0][0], 0)
+                    self.assertEqual(spans[-1][1], len(data))
+                    for (_, end), (start, _) in zip(spans, spans[1:]):
+                        self.assertEqual(end, start)
+                        # Cuts land just after a newline, never mid-line
+                        # or between the CR and LF of a CRLF ending.
+                        self.assertEqual(data[start - 1 : start], b"\n")
+                    lines = [line for start, end in spans for line in data[start:end].splitlines(keepends=True)]
+                    self.assertEqual(lines, data.splitlines(keepends=True))
+            # With a chunk size of 1 every span is non-empty and ends with a
+            # whole line; the last one is the line without a newline.
+            spans = self.mod._split_log_file(str(path), len(data), 1)
+            self.assertGreater(len(spans), 3)
+            self.assertTrue(all(start < end for start, end in spans))
+            self.assertTrue(all(data[end - 1 : end] == b"\n" for _, end in spans[:-1]))
+            self.assertEqual(data[spans[-1][0] :], data.splitlines(keepends=True)[-1])
+
+    def test_plan_tasks_splits_only_oversized_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            big = self.write_log(root, "big.jsonl")
+            small = root / "small.jsonl"
+            small.write_bytes(b'{"call": "x"}\n')
+            missing = root / "missing.jsonl"
+            files = [str(small), str(big), str(missing)]
+            paths, spans = self.mod._plan_tasks(files, 40)
+            expected = self.mod._split_log_file(str(big), big.stat().st_size, 40)
+        self.assertEqual(paths[0], str(small))
+        self.assertIsNone(spans[0])
+        self.assertEqual(paths[-1], str(missing))
+        self.assertIsNone(spans[-1])
+        big_spans = spans[1:-1]
+        self.assertGreater(len(big_spans), 1)
+        self.assertTrue(all(p == str(big) for p in paths[1:-1]))
+        self.assertEqual(big_spans, expected)
+
+    def test_parallel_matches_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "nested").mkdir()
+            self.write_log(root, "a.jsonl")
+            self.write_log(root / "nested", "b.log")
+            (root / "c.jsonl").write_bytes(b'{"call": "memcpy", "latency_ns": 3}\n')
+            serial = self.mod.analyze(root, 5)
+            original = self.mod.LOG_CHUNK_BYTES
+            try:
+                for chunk_bytes in (1, 30, original):
+                    self.mod.LOG_CHUNK_BYTES = chunk_bytes
+                    with self.subTest(chunk_bytes=chunk_bytes):
+                        self.assertEqual(self.mod.analyze(root, 5, jobs=2), serial)
+            finally:
+                self.mod.LOG_CHUNK_BYTES = original
+        self.assertEqual(serial["files_scanned"], 3)
+        self.assertEqual(serial["latency_ns"]["count"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[attr-defined]
+    return module
+
+
+def build_elf64(e_type: int, segments: list[tuple[int, bytes]]) -> bytes:
+    """Little-endian ELF64 image whose program headers point at ``segments``."""
+    phoff = 64
+    data_offset = phoff + 56 * len(segments)
+    phdrs = b""
+    payload = b""
+    for p_type, content in segments:
+        offset = data_offset + len(payload)
+        phdrs += struct.pack("<IIQQQQQQ", p_type, 4, offset, 0, 0, len(content), len(content), 8)
+        payload += content
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + bytes(9)
+    header = ident + struct.pack("<HHIQQQIHHHHHH", e_type, 62, 1, 0, phoff, 0, 0, 64, 56, len(segments), 64, 0, 0)
+    return header + phdrs + payload
+
+
+def dynamic_section(*entries: tuple[int, int]) -> bytes:
+    return b"".join(struct.pack("<QQ", tag, value) for tag, value in entries) + bytes(16)
+
+
+class DetectStaticTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repo = Path(__file__).resolve().parents[2]
+        cls.mod = load_module("detect_static", repo / "scripts/gentoo/detect-static.py")
+
+    def classify(self, content: bytes) -> tuple[bool, bool, bool]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bin"
+            path.write_bytes(content)
+            row = self.mod.inspect_file(path)
+        return row["is_elf"], row["is_static"], row["is_dynamic"]
+
+    def test_static_executable(self) -> None:
+        self.assertEqual(self.classify(build_elf64(2, [(1, b"")])), (True, True, False))
+
+    def test_dynamic_executable(self) -> None:
+        image = build_elf64(3, [(3, b"/lib/ld.so\0"), (2, dynamic_section((1, 1), (0x6FFFFFFB, 0x08000000)))])
+        self.assertEqual(self.classify(image), (True, False, True))
+
+    def test_static_pie(self) -> None:
+        image = build_elf64(3, [(2, dynamic_section((0x6FFFFFFB, 0x08000001)))])
+        self.assertEqual(self.classify(image), (True, True, False))
+
+    def test_shared_object_without_dependencies(self) -> None:
+        image = build_elf64(3, [(2, dynamic_section((0x6FFFFFFB, 0x1)))])
+        self.assertEqual(self.classify(image), (True, False, True))
+
+    def test_relocatable_and_truncated(self) -> None:
+        self.assertEqual(self.classify(build_elf64(1, [])), (True, False, False))
+        self.assertEqual(self.classify(b"\x7fELF\x02"), (True, False, False))
+        self.assertEqual(self.classify(b"#!/bin/sh\n"), (False, False, False))
+
+    def test_symlink_not_followed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "bin"
+            target.write_bytes(build_elf64(2, [(1, b"")]))
+            link = Path(tmp) / "link"
+            os.symlink(target, link)
+            row = self.mod.inspect_file(link)
+        self.assertFalse(row["is_elf"])
+
+    def test_scan_tree_parallel_matches_walk_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for sub in ("a/x", "b", "c"):
+                (root / sub).mkdir(parents=True)
+            for rel in ("top.bin", "a/one", "a/x/two", "a/notes.md", "b/three", "c/four.py", "c/five"):
+                (root / rel).write_bytes(b"")
+            os.symlink(root / "a", root / "c" / "alink")
+
+            walked = []
+            for base, _, files in os.walk(root):
+                for name in files:
+                    walked.append(os.path.join(base, name))
+            serial = self.mod.scan_tree(str(root), 100)
+            parallel = self.mod.scan_tree(str(root), 100, jobs=2)
+            capped = self.mod.scan_tree(str(root), 3, jobs=2)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(len(serial), len(walked))
+        # The symlinked directory is neither entered nor counted, as in os.walk().
+        expected = [None if p.endswith((".md", ".py")) else p for p in walked]
+        self.assertEqual(serial, expected)
+        self.assertEqual(capped, serial[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
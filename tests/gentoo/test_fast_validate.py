@@ -223,6 +223,7 @@ class TestDryRunExecution(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             env = os.environ.copy()
             # Override artifact output to temp dir
+            env["FAST_VALIDATE_RESULTS_ROOT"] = tmpdir
             env["FRANKENLIBC_MODE"] = "hardened"
             result = subprocess.run(
                 ["bash", str(FAST_VALIDATE_SCRIPT), "--dry-run"],
@@ -246,44 +247,42 @@ class TestDryRunExecution(unittest.TestCase):
             )
 
     def test_dry_run_creates_per_package_results(self) -> None:
-        result = subprocess.run(
-            ["bash", str(FAST_VALIDATE_SCRIPT), "--dry-run"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(REPO_ROOT),
-        )
-        self.assertEqual(result.returncode, 0, f"Dry-run failed: {result.stderr[-300:]}")
-
-        # Find the most recent fast-validate results dir
-        fast_dir = REPO_ROOT / "artifacts" / "gentoo-builds" / "fast-validate"
-        if not fast_dir.exists():
-            self.skipTest("No fast-validate artifacts directory created")
-
-        runs = sorted(fast_dir.iterdir(), reverse=True)
-        self.assertTrue(len(runs) > 0, "No dry-run result directories found")
-
-        latest = runs[0]
-        summary = latest / "summary.json"
-        self.assertTrue(summary.exists(), f"summary.json not found in {latest}")
-
-        data = json.loads(summary.read_text())
-        self.assertEqual(data["total_packages"], 5)
-        self.assertEqual(data["passed"], 5)
-        self.assertEqual(data["failed"], 0)
-        self.assertTrue(data["dry_run"])
-        self.assertEqual(data["bead"], "bd-2icq.18")
-
-        # Verify per-package result files
-        pkg_dir = latest / "packages"
-        self.assertTrue(pkg_dir.exists(), "packages/ subdirectory not found")
-        pkg_results = list(pkg_dir.glob("*/fast_validate_result.json"))
-        self.assertEqual(
-            len(pkg_results),
-            5,
-            f"Expected 5 per-package results, found {len(pkg_results)}",
-        )
-
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = os.environ.copy()
+            env["FAST_VALIDATE_RESULTS_ROOT"] = tmpdir
+            result = subprocess.run(
+                ["bash", str(FAST_VALIDATE_SCRIPT), "--dry-run"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=str(REPO_ROOT),
+                env=env,
+            )
+            self.assertEqual(result.returncode, 0, f"Dry-run failed: {result.stderr[-300:]}")
+
+            runs = sorted(Path(tmpdir).iterdir(), reverse=True)
+            self.assertTrue(len(runs) > 0, "No dry-run result directories found")
+
+            latest = runs[0]
+            summary = latest / "summary.json"
+            self.assertTrue(summary.exists(), f"summary.json not found in {latest}")
+
+            data = json.loads(summary.read_text())
+            self.assertEqual(data["total_packages"], 5)
+            self.assertEqual(data["passed"], 5)
+            self.assertEqual(data["failed"], 0)
+            self.assertTrue(data["dry_run"])
+            self.assertEqual(data["bead"], "bd-2icq.18")
+
+            # Verify per-package result files
+            pkg_dir = latest / "packages"
+            self.assertTrue(pkg_dir.exists(), "packages/ subdirectory not found")
+            pkg_results = list(pkg_dir.glob("*/fast_validate_result.json"))
+            self.assertEqual(
+                len(pkg_results),
+                5,
+                f"Expected 5 per-package results, found {len(pkg_results)}",
+            )
 
 if __name__ == "__main__":
     unittest.main()
@@ -34,6 +34,27 @@ class HealingAnalysisTests(unittest.TestCase):
         self.assertEqual(summary["breakdown"]["ClampSize"], 2)
         self.assertIn("dev-db/redis", summary["by_package"])
 
+    def test_analyze_healing_parallel_matches_serial(self) -> None:
+        lines = self.sample_log.read_text(encoding="utf-8").splitlines(keepends=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "nested").mkdir()
+            (root / "a.jsonl").write_text("".join(lines[::2]), encoding="utf-8")
+            (root / "nested" / "b.jsonl").write_text("".join(lines[1::2]) + "{bad\n", encoding="utf-8")
+            serial = self.analyze_mod.analyze(root)
+            parallel = self.analyze_mod.analyze(root, jobs=2)
+            low_memory = self.analyze_mod.analyze(root, top_n=2, jobs=2, low_memory=True)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(low_memory["top_call_sites"], serial["top_call_sites"][:2])
+        self.assertEqual(serial["total_healing_actions"], 5)
+        self.assertEqual(serial["parse_errors"], 1)
+
+    def test_parse_line_keeps_big_integers_exact(self) -> None:
+        big = 2**64 + 1
+        payload = self.analyze_mod.parse_line(f'{{"call": {big}, "latency_ns": {big}, "size": 1.5}}'.encode())
+        self.assertEqual(payload, {"call": big, "latency_ns": big, "size": 1.5})
+        self.assertIs(type(payload["latency_ns"]), int)
+
     def test_detect_patterns(self) -> None:
         summary = self.analyze_mod.analyze(self.sample_log)
         patterns = self.pattern_mod.detect_patterns(summary)
@@ -46,6 +67,38 @@ class HealingAnalysisTests(unittest.TestCase):
         candidates = self.fp_mod.detect_false_positives(summary, max_action_rate_per_1000=50.0, clamp_margin=0.05)
         self.assertGreaterEqual(len(candidates), 1)
 
+    def test_false_positive_detector_keeps_infinite_rate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "summary.json"
+            path.write_text('{"by_package": {"dev-db/redis": {"actions_per_1000_calls": Infinity}}}', encoding="utf-8")
+            summary = self.fp_mod.load_summary(path)
+        candidates = self.fp_mod.detect_false_positives(summary, max_action_rate_per_1000=50.0, clamp_margin=0.05)
+        rendered = self.fp_mod.render_json({"candidates": candidates})
+        self.assertIn('"actions_per_1000_calls": Infinity', rendered)
+        self.assertEqual(json.loads(rendered)["candidates"][0]["actions_per_1000_calls"], float("inf"))
+
+    def test_false_positive_detector_keeps_big_integers_exact(self) -> None:
+        big = 2**64 + 1
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "summary.json"
+            path.write_text(
+                json.dumps(
+                    {
+                        "by_package": {"dev-db/redis": {"actions_per_1000_calls": big}},
+                        "top_call_sites": [
+                            {"healing_action": "ClampSize", "original_size_avg": big, "clamped_size_avg": big}
+                        ],
+                    }
+                ),
+                encoding="utf-8",
+            )
+            summary = self.fp_mod.load_summary(path)
+        candidates = self.fp_mod.detect_false_positives(summary, max_action_rate_per_1000=50.0, clamp_margin=0.05)
+        self.assertEqual(len(candidates), 2)
+        rendered = self.fp_mod.render_json({"candidates": candidates})
+        self.assertEqual(rendered.count(str(big)), 3)
+        self.assertNotIn("e+19", rendered)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -53,6 +54,65 @@ class LogParserTests(unittest.TestCase):
         self.assertEqual(len(parser.errors), 1)
         self.assertIn("missing required field", str(parser.errors[0]))
 
+    def test_big_integer_latency_stays_exact(self) -> None:
+        big = 2**64 + 1
+        line = f'{{"ts": "t", "pid": 1, "call": "malloc", "latency_ns": {big}}}'
+        parser = self.log_parser.LogParser(strict=True)
+        self.assertEqual(parser.parse_line(line).latency_ns, big)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "big.jsonl"
+            path.write_text(line + "\n", encoding="utf-8")
+            entries = list(parser.parse_file(path))
+        self.assertEqual(entries[0].latency_ns, big)
+
+    def test_raw_payload_dropped_by_default(self) -> None:
+        line = '{"ts": "t", "pid": 1, "call": "malloc", "latency_ns": 5}'
+        first = self.log_parser.LogParser().parse_line(line)
+        second = self.log_parser.LogParser().parse_line(line)
+        self.assertEqual(dict(first.raw), {})
+        self.assertIs(first.raw, second.raw)
+        with self.assertRaises(TypeError):
+            first.raw["call"] = "free"  # type: ignore[index]
+
+    def test_keep_raw_retains_payload(self) -> None:
+        parser = self.log_parser.LogParser(keep_raw=True)
+        entries = list(parser.parse_file(self.fixtures / "valid_runtime.jsonl"))
+        self.assertEqual(entries[0].raw["call"], "malloc")
+        self.assertEqual(entries[0].raw["latency_ns"], 185)
+
+    def test_parse_file_bytes_path_matches_text_path(self) -> None:
+        data = (
+            b'{"ts": "t", "pid": 1, "call": "malloc", "latency_ns": 5}\n'
+            b"\n"
+            b"   \r\n"
+            b'{"ts": "t", "pid": 1, "call": "\xff\xfe"}\n'
+            b'\xef\xbb\xbf{"ts": "t", "pid": 2, "call": "bom"}\n'
+            b'{"ts": "t", "pid": 3, "call": "crlf"}\r\n'
+            b'{"ts": "t", "pid": 4, "call": "last"}'
+        )
+        file_parser = self.log_parser.LogParser(strict=False, keep_raw=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "mixed.jsonl"
+            path.write_bytes(data)
+            from_file = list(file_parser.parse_file(path))
+        line_parser = self.log_parser.LogParser(strict=False, keep_raw=True)
+        from_lines = [
+            entry
+            for line_num, line in enumerate(data.decode("utf-8", errors="replace").split("\n"), 1)
+            if (entry := line_parser.parse_line(line, line_num)) is not None
+        ]
+
+        self.assertEqual(from_file, from_lines)
+        self.assertEqual([e.call for e in from_file], ["malloc", "\ufffd\ufffd", "crlf", "last"])
+        self.assertEqual([e.source_line for e in from_file], [1, 4, 6, 7])
+        # The BOM-prefixed line is rejected on both paths, with the stdlib message.
+        self.assertEqual(
+            [(e.line_num, e.message) for e in file_parser.errors],
+            [(e.line_num, e.message) for e in line_parser.errors],
+        )
+        self.assertEqual([e.line_num for e in file_parser.errors], [5])
+        self.assertIn("BOM", file_parser.errors[0].message)
+
     def test_stats_and_validator(self) -> None:
         parser = self.log_parser.LogParser(strict=True)
         entries = list(parser.parse_file(self.fixtures / "valid_runtime.jsonl"))
@@ -247,6 +247,30 @@ class TestValidateBinder(unittest.TestCase):
         report = validate_binder(BINDER_PATH, REPO_ROOT, check_hashes=False)
         self.assertGreater(report.total_obligations, 0)
 
+    def test_parallel_matches_serial(self) -> None:
+        obligations = [
+            {"id": f"PO-{i % 5}", "statement": str(i), "category": "c",
+             "evidence_artifacts": ["README.md", "nonexistent/proof.json"][: i % 3],
+             "gates": [], "join_keys": ["k"], "scope": {"m": "v"},
+             "source_refs": ["README.md:1", "README.md:999999", "bad"][: i % 4]}
+            for i in range(12)
+        ]
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump({"schema_version": "v1", "obligations": obligations}, f)
+            f.flush()
+            serial = validate_binder(Path(f.name), REPO_ROOT, jobs=1)
+            parallel = validate_binder(Path(f.name), REPO_ROOT, jobs=4)
+            nonpositive = [validate_binder(Path(f.name), REPO_ROOT, jobs=jobs) for jobs in (0, -1)]
+        serial.timestamp = parallel.timestamp
+        self.assertEqual(serial.to_dict(), parallel.to_dict())
+        for report in nonpositive:
+            report.timestamp = serial.timestamp
+            self.assertEqual(report.to_dict(), serial.to_dict())
+        self.assertEqual(
+            [o.statement for o in parallel.obligations],
+            [str(i) for i in range(12)],
+        )
+
     def test_missing_binder(self) -> None:
         report = validate_binder(Path("/nonexistent"), REPO_ROOT)
         self.assertFalse(report.binder_valid)
@@ -284,6 +284,22 @@ class TestHealingActionParsing(unittest.TestCase):
         self.assertEqual(actions["IgnoreDoubleFree"], 1)
         self.assertEqual(sum(actions.values()), 3)
 
+    def test_count_healing_actions(self) -> None:
+        """count_healing_actions should stream the log and tally actions."""
+        log_file = self.tmp_path / "frankenlibc.jsonl"
+        log_file.write_text(
+            '{"action": "ClampSize", "call": "memcpy"}\n'
+            "\n"
+            '{"call": "malloc"}\n'
+            '{"action": "ClampSize", "call": "memmove"}\r\n'
+            '{"action": "IgnoreDoubleFree", "call": "free"}',
+            encoding="utf-8",
+        )
+
+        actions = self.module.count_healing_actions(log_file)
+
+        self.assertEqual(actions, {"ClampSize": 2, "IgnoreDoubleFree": 1})
+
     def test_invalid_json_handling(self) -> None:
         """Invalid JSON lines should not crash parsing."""
         log_file = self.tmp_path / "frankenlibc.jsonl"